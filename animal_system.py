@@ -1,24 +1,100 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
 from srpg_stats import create_stats_from_template, HERBIVORE_STATS
 from srpg_combat import CombatResolver
 from balance_config import HERBIVORE_CONFIG
-import uuid
+from terrain_generator import NUM_BIOMES
+import itertools
+
+# Integer species ids (HERBIVORE_STATS order) used to index the per-species lookup tables
+SPECIES_NAMES = list(HERBIVORE_STATS.keys())
+SPECIES_INDEX = {name: i for i, name in enumerate(SPECIES_NAMES)}
+
+# Death cause codes used by the vectorized update (-1 = still alive / unknown)
+DEATH_CAUSES = ('old_age', 'cold', 'heat', 'starvation')
+CAUSE_OLD_AGE, CAUSE_COLD, CAUSE_HEAT, CAUSE_STARVATION = range(len(DEATH_CAUSES))
+
+# Sequence for Animal ids; far cheaper than uuid4 for the many newborns each turn
+_animal_ids = itertools.count()
+
+# Herbivores flee predators inside this wrapped Chebyshev radius
+PREDATOR_SCAN_RADIUS = 4
+
+# Movers are scored in blocks of this many animals, which keeps the
+# (animals x candidate cells) score matrices cache sized on large populations
+MOVE_BLOCK_SIZE = 2048
+
+class SpatialGrid:
+    """Read-only (x, y) -> [animals] lookup backed by a counting-sort cell index
+
+    Built in one vectorized pass; animals are bucketed by flat cell id, so a
+    cell's occupants are one contiguous slice of the sorted order.
+    """
+    def __init__(self, animals, xs, ys, width, height):
+        self.animals = list(animals)
+        self.xs, self.ys = xs, ys
+        self.width = width
+        self.height = height
+        cell_ids = ys.astype(np.intp) * width + xs
+        self.order = np.argsort(cell_ids, kind='stable')
+        self.cell_start = np.zeros(width * height + 1, dtype=np.intp)
+        np.cumsum(np.bincount(cell_ids, minlength=width * height), out=self.cell_start[1:])
+
+    def _span(self, pos):
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return 0, 0
+        cell = int(y) * self.width + int(x)
+        return self.cell_start[cell], self.cell_start[cell + 1]
+
+    def __contains__(self, pos):
+        start, end = self._span(pos)
+        return end > start
+
+    def __getitem__(self, pos):
+        start, end = self._span(pos)
+        if end == start:
+            raise KeyError(pos)
+        return [self.animals[i] for i in self.order[start:end].tolist()]
+
+    def get(self, pos, default=None):
+        start, end = self._span(pos)
+        if end == start:
+            return default
+        return [self.animals[i] for i in self.order[start:end].tolist()]
+
+    def box_indices(self, x0, y0, x1, y1):
+        """Indices of the animals in cells x0 <= x < x1, y0 <= y < y1 (clipped to the map), ascending"""
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.width), min(y1, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return np.zeros(0, dtype=np.intp)
+        # Each row of the box is one contiguous run of cells
+        rows = [self.order[self.cell_start[y * self.width + x0]:self.cell_start[y * self.width + x1]]
+                for y in range(y0, y1)]
+        return np.sort(np.concatenate(rows))
+
+    def __len__(self):
+        """Number of occupied cells"""
+        return int(np.count_nonzero(np.diff(self.cell_start)))
+
+    def __bool__(self):
+        return len(self.order) > 0
 
 class Animal:
     """Base class for all animal species"""
     def __init__(self, x, y, species_name):
-        self.id = str(uuid.uuid4())
+        self.id = f"herbivore-{next(_animal_ids)}"
         self.x = x
         self.y = y
         self.species = species_name
+        self.species_idx = SPECIES_INDEX.get(species_name, SPECIES_INDEX['deer'])
         
         # Initialize stats from template
         template = HERBIVORE_STATS.get(species_name, HERBIVORE_STATS['deer'])
         self.combat_stats = create_stats_from_template(template)
         self.movement_stats = template['movement']
         self.env_stats = template.get('environment', None)
+        self._repro_threshold = template.get('reproduction_threshold', 20)
         
         self.age = 0
         self.reproductive_cooldown = 0
@@ -61,9 +137,7 @@ class Animal:
         return self.combat_stats.is_alive()
     
     def can_reproduce(self):
-        template = HERBIVORE_STATS.get(self.species, HERBIVORE_STATS['deer'])
-        threshold = template.get('reproduction_threshold', 20)
-        return (self.combat_stats.current_hp >= threshold and 
+        return (self.combat_stats.current_hp >= self._repro_threshold and 
                 self.reproductive_cooldown == 0 and 
                 self.age > 8)  # Increased age requirement
 
@@ -76,6 +150,12 @@ class AnimalSystem:
         self.width = world_generator.width
         self.height = world_generator.height
         self.combat_resolver = CombatResolver(world_generator)
+        # Seeded from the global NumPy state so seeded worlds stay reproducible
+        self.rng = np.random.default_rng(np.random.randint(0, 2**31))
+        
+        # Wrapped coordinate tables: wrap_x[x + dx + width] == (x + dx) % width for |dx| <= width
+        self._wrap_x = np.tile(np.arange(self.width), 3)
+        self._wrap_y = np.tile(np.arange(self.height), 3)
         
         # Animal populations
         self.herbivores = []
@@ -83,375 +163,520 @@ class AnimalSystem:
         
         # Use SRPG stats instead of local definitions
         self.herbivore_species = HERBIVORE_STATS
-        
-        # Statistics tracking
-        self.population_history = {species: [] for species in self.herbivore_species.keys()}
+        self._build_species_tables()
+        self._terrain_field_biomes = None
+        self._terrain_field_cache = None
+
+        # Per-turn structure-of-arrays view of the population (see _gather_state),
+        # in compact dtypes: coordinates fit int16 and HP never exceeds a few hundred
+        self.xs = np.zeros(0, dtype=np.int16)
+        self.ys = np.zeros(0, dtype=np.int16)
+        self.hp = np.zeros(0, dtype=np.int16)
+        self.age = np.zeros(0, dtype=np.uint16)
+        self.cooldown = np.zeros(0, dtype=np.uint8)
+        self.species_idx = np.zeros(0, dtype=np.uint8)
+        self.cause = np.zeros(0, dtype=np.int8)
+
+        # Statistics tracking: population per species id (rows) and turn (columns),
+        # with capacity doubled on demand
+        self._history = np.zeros((len(SPECIES_NAMES), 64), dtype=np.int32)
+        self._history_len = 0
         self.recent_deaths = {} # Stores death counts by cause for the last update
         
     def set_logger(self, callback):
         """Set callback for logging interactions"""
         self.logger_callback = callback
 
+    @property
+    def population_history(self):
+        """Population by turn for each species, as {species: [count, ...]}"""
+        return dict(zip(SPECIES_NAMES, self._history[:, :self._history_len].tolist()))
+
+    @population_history.setter
+    def population_history(self, history):
+        """Load {species: [count, ...]} (e.g. from a save); shorter series are aligned to the latest turn"""
+        turns = max((len(history.get(name, [])) for name in SPECIES_NAMES), default=0)
+        self._history = np.zeros((len(SPECIES_NAMES), max(64, 2 * turns)), dtype=np.int32)
+        for i, name in enumerate(SPECIES_NAMES):
+            counts = history.get(name, [])
+            self._history[i, turns - len(counts):turns] = counts
+        self._history_len = turns
+
+    def _build_species_tables(self):
+        """Flatten per-species template fields into arrays indexed by species id"""
+        default_metabolism = HERBIVORE_CONFIG.get('metabolism_multiplier', 1.0)
+        templates = [self.herbivore_species[name] for name in SPECIES_NAMES]
+        envs = [t.get('environment', None) for t in templates]
+
+        self.max_hp_lut = np.array([t['stats'].max_hp for t in templates])
+        self.defense_lut = np.array([t['stats'].defense for t in templates])
+        self.metabolism_lut = np.array([t.get('metabolism_multiplier', default_metabolism) for t in templates])
+        self.has_env_lut = np.array([e is not None for e in envs])
+        self.max_age_lut = np.array([e.max_age if e else 0 for e in envs])
+        self.min_temp_lut = np.array([e.min_temp if e else 0.0 for e in envs])
+        self.max_temp_lut = np.array([e.max_temp if e else 1.0 for e in envs])
+        self.cold_blooded_lut = np.array([e.cold_blooded if e else False for e in envs])
+        self.repro_threshold_lut = np.array([t.get('reproduction_threshold', 20) for t in templates])
+        self.offspring_lut = np.array([t.get('offspring_count', 1) for t in templates])
+
+        # Integer HP amounts: whole and fractional metabolism cost, reproduction
+        # cost (30% of max HP) and newborn HP (50% of max HP)
+        self.metabolism_whole_lut = self.metabolism_lut.astype(int)
+        self.metabolism_frac_lut = self.metabolism_lut - self.metabolism_whole_lut
+        self.repro_cost_lut = (self.max_hp_lut * 0.3).astype(int)
+        self.newborn_hp_lut = (self.max_hp_lut * 0.5).astype(int)
+
+        # Movement: range, swimming and terrain preference (default 0.3) per biome
+        movements = [t['movement'] for t in templates]
+        self.move_range_lut = np.array([m.movement_range for m in movements])
+        self.can_swim_lut = np.array([m.can_swim for m in movements])
+        self.pref_lut = np.full((len(templates), NUM_BIOMES), 0.3)
+        for i, m in enumerate(movements):
+            for biome, pref in m.terrain_preferences.items():
+                self.pref_lut[i, biome] = pref
+
+        # Candidate move offsets per movement range: cells within that distance,
+        # scanned row by row (centre excluded)
+        self._move_offsets = {}
+        for r in np.unique(self.move_range_lut).tolist():
+            dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+            dist = np.sqrt(dx ** 2 + dy ** 2)
+            keep = ((dx != 0) | (dy != 0)) & (dist <= r)
+            dist_penalty = 1.0 / (1.0 + dist[keep] * 0.2)
+            self._move_offsets[r] = (dx[keep], dy[keep], dist_penalty)
+
+    def _terrain_field(self):
+        """Per-species terrain preference over the map, -inf on water for non-swimmers
+
+        Only depends on the biome map, so it is rebuilt only when that changes.
+        """
+        biomes = self.world.biomes
+        if self._terrain_field_biomes is not biomes:
+            self._terrain_field_cache = np.where(self.can_swim_lut[:, None, None] | (biomes > 1),
+                                                 self.pref_lut[:, biomes], -np.inf)
+            self._terrain_field_biomes = biomes
+        return self._terrain_field_cache
+
+    def _gather_state(self):
+        """Copy per-animal scalars from the Animal objects into parallel arrays"""
+        herbivores = self.herbivores
+        n = len(herbivores)
+        self.xs = np.fromiter((a.x for a in herbivores), dtype=np.int16, count=n)
+        self.ys = np.fromiter((a.y for a in herbivores), dtype=np.int16, count=n)
+        self.hp = np.fromiter((a.combat_stats.current_hp for a in herbivores), dtype=np.int16, count=n)
+        self.age = np.fromiter((a.age for a in herbivores), dtype=np.uint16, count=n)
+        self.cooldown = np.fromiter((a.reproductive_cooldown for a in herbivores), dtype=np.uint8, count=n)
+        self.species_idx = np.fromiter((a.species_idx for a in herbivores), dtype=np.uint8, count=n)
+        self.cause = np.full(n, -1, dtype=np.int8)
+
+    def _scatter_state(self):
+        """Write the array state back onto the (living) Animal objects"""
+        for animal, x, y, hp, age, cooldown in zip(
+                self.herbivores, self.xs.tolist(), self.ys.tolist(), self.hp.tolist(),
+                self.age.tolist(), self.cooldown.tolist()):
+            animal.x = x
+            animal.y = y
+            animal.combat_stats.current_hp = hp
+            animal.age = age
+            animal.reproductive_cooldown = cooldown
+
+    def _remove_dead(self):
+        """Record deaths and compact the herbivore list and arrays down to the living
+
+        Returns the indices of the survivors in the pre-compaction order.
+        """
+        alive = self.hp > 0
+        live = np.flatnonzero(alive)
+        herbivores = self.herbivores
+        
+        # Write back the final state of the dead and collect death stats
+        dead = np.flatnonzero(~alive)
+        for i, x, y, hp, age, cooldown, code in zip(
+                dead.tolist(), self.xs[dead].tolist(), self.ys[dead].tolist(), self.hp[dead].tolist(),
+                self.age[dead].tolist(), self.cooldown[dead].tolist(), self.cause[dead].tolist()):
+            a = herbivores[i]
+            a.x, a.y = x, y
+            a.combat_stats.current_hp = hp
+            a.age = age
+            a.reproductive_cooldown = cooldown
+            if code >= 0 and a.cause_of_death is None:
+                a.cause_of_death = DEATH_CAUSES[code]
+            
+            cause = a.cause_of_death if a.cause_of_death else 'unknown'
+            if cause not in self.recent_deaths:
+                self.recent_deaths[cause] = 0
+            self.recent_deaths[cause] += 1
+            
+            if self.logger_callback:
+                self.logger_callback('death', a.species, details=cause)
+        
+        if len(dead):
+            self.herbivores = [herbivores[i] for i in live.tolist()]
+            self.xs, self.ys = self.xs[live], self.ys[live]
+            self.hp, self.age = self.hp[live], self.age[live]
+            self.cooldown, self.species_idx = self.cooldown[live], self.species_idx[live]
+            self.cause = self.cause[live]
+        return live
+
+    def _update_metabolism(self, climate_engine):
+        """Aging, old-age mortality, temperature stress and metabolism in one vectorized pass"""
+        sid = self.species_idx
+        n = len(sid)
+        rolls = self.rng.random((2, n))
+        alive = self.hp > 0
+        self.age += alive
+        has_env = self.has_env_lut[sid]
+        defense = self.defense_lut[sid]
+
+        # Mortality check (Old Age): chance to die increases with turns past max age
+        over_age = self.age - self.max_age_lut[sid]
+        past_max_age = has_env & (over_age > 0)
+        old_age = alive & past_max_age & (rolls[1] < 0.05 + over_age * 0.02)
+        self.hp[old_age] = 0
+        self.cause[old_age] = CAUSE_OLD_AGE
+        active = alive & ~old_age
+
+        # Base metabolism cost (1 HP per turn * multiplier, probabilistic for fractional values)
+        # plus the legacy age penalty past 40 for everyone not already past their max age
+        metabolism_cost = (self.metabolism_whole_lut[sid] + (rolls[0] < self.metabolism_frac_lut[sid]) +
+                           (~past_max_age & (self.age > 40)))
+
+        # Temperature stress: cold (double for cold blooded) or heat, never both.
+        # Most animals sit inside their tolerance range, so damage is only worked
+        # out for the ones outside it
+        cell_ids = self.ys.astype(np.intp) * self.width + self.xs
+        local_temp = climate_engine.world.temperature.ravel().take(cell_ids)
+        min_temp = self.min_temp_lut[sid]
+        max_temp = self.max_temp_lut[sid]
+        exposed = np.flatnonzero(active & has_env & ((local_temp < min_temp) | (local_temp > max_temp)))
+        if len(exposed):
+            e_sid = sid[exposed]
+            e_temp = local_temp[exposed]
+            is_cold = e_temp < min_temp[exposed]
+            cold_damage = ((min_temp[exposed] - e_temp) * 20).astype(int)
+            cold_damage = np.where(self.cold_blooded_lut[e_sid], (cold_damage * 2.0).astype(int), cold_damage)
+            heat_damage = ((e_temp - max_temp[exposed]) * 20).astype(int)
+            stress_damage = np.where(is_cold, cold_damage, heat_damage)
+
+            # Same rules as CombatStats.take_damage: defense mitigates, but never below 1 HP
+            stressed = stress_damage > 0
+            exposed, is_cold, stress_damage = exposed[stressed], is_cold[stressed], stress_damage[stressed]
+            e_hp = self.hp[exposed]
+            e_hp -= np.minimum(np.maximum(1, stress_damage - defense[exposed]), e_hp)
+            self.hp[exposed] = e_hp
+            self.cause[exposed[e_hp <= 0]] = np.where(is_cold[e_hp <= 0], CAUSE_COLD, CAUSE_HEAT)
+
+        starving = active & (self.hp > 0)
+        self.hp -= np.where(starving, np.minimum(np.maximum(1, metabolism_cost - defense), self.hp), 0)
+        self.cause[starving & (self.hp <= 0)] = CAUSE_STARVATION
+
+        # Cooldown
+        self.cooldown -= active & (self.cooldown > 0)
+
     def spawn_initial_populations(self, population_per_species=50):
         """Place initial herbivore populations in suitable habitats"""
         for species_name, species_data in self.herbivore_species.items():
-            spawned = 0
-            attempts = 0
-            max_attempts = population_per_species * 10
-            
-            movement_stats = species_data['movement']
-            preferred_biomes = [b for b, m in movement_stats.terrain_preferences.items() if m >= 0.8]
-            
-            while spawned < population_per_species and attempts < max_attempts:
-                attempts += 1
-                x = np.random.randint(0, self.width)
-                y = np.random.randint(0, self.height)
-                
-                biome = self.world.biomes[y, x]
-                veg_density = self.vegetation.density[y, x]
-                
-                # Check if location is suitable
-                if (biome in preferred_biomes and veg_density > 0.2):
-                    animal = Animal(x, y, species_name)
-                    # Start with 80-100% HP
-                    start_hp_percent = np.random.uniform(0.8, 1.0)
-                    animal.combat_stats.current_hp = int(animal.combat_stats.max_hp * start_hp_percent)
-                    self.herbivores.append(animal)
-                    spawned += 1
+            # Suitable locations: preferred biome (terrain preference of 0.8 or better) with vegetation
+            preferred = self.pref_lut[SPECIES_INDEX[species_name]] >= 0.8
+            suitable = preferred[self.world.biomes] & (self.vegetation.density > 0.2)
+            
+            # Up to 10 random tries per animal; the first suitable ones are kept, so
+            # scarce habitat yields fewer animals and they rarely share a cell
+            tries = self.rng.integers(0, suitable.size, population_per_species * 10)
+            picks = tries[suitable.ravel()[tries]][:population_per_species]
+            spawned = len(picks)
+            ys, xs = np.divmod(picks, self.width)
+            
+            # Start with 80-100% HP
+            start_hp_percent = self.rng.uniform(0.8, 1.0, spawned)
+            for x, y, hp_percent in zip(xs.tolist(), ys.tolist(), start_hp_percent.tolist()):
+                animal = Animal(x, y, species_name)
+                animal.combat_stats.current_hp = int(animal.combat_stats.max_hp * hp_percent)
+                self.herbivores.append(animal)
             
             print(f"  🦌 Spawned {spawned} {species_name}")
         
         # Initialize history
-        for species_name in self.herbivore_species.keys():
-            count = sum(1 for a in self.herbivores if a.species == species_name)
-            self.population_history[species_name].append(count)
+        self._record_population()
     
     def update(self, climate_engine, predators_list=None, tribe_units=None):
         """Update all animal behaviors for one turn"""
-        # Build spatial map for fast neighbor lookups
-        # Key: (x, y), Value: list of animals
-        self.spatial_map = {}
-        for animal in self.herbivores:
-            pos = (animal.x, animal.y)
-            if pos not in self.spatial_map:
-                self.spatial_map[pos] = []
-            self.spatial_map[pos].append(animal)
-
-        # Build predator map if provided
-        predator_map = {}
+        # Collect predator positions if provided
+        predator_xs = predator_ys = None
         if predators_list:
-            for p in predators_list:
-                pos = (p.x, p.y)
-                if pos not in predator_map:
-                    predator_map[pos] = []
-                predator_map[pos].append(p)
-        
-        # Add tribe units to predator map (as threats)
-        if tribe_units:
-            for u in tribe_units:
-                pos = (u.x, u.y)
-                if pos not in predator_map:
-                    predator_map[pos] = []
-                predator_map[pos].append(u)
+            # Tribe units count as threats too
+            threats = set((p.x, p.y) for p in predators_list)
+            if tribe_units:
+                threats.update((u.x, u.y) for u in tribe_units)
+            predator_xs, predator_ys = np.array(sorted(threats), dtype=int).T
 
         # Age and metabolism
-        for animal in self.herbivores:
-            if not animal.is_alive(): continue
-
-            animal.age += 1
-            
-            # Get species data for metabolism
-            species_data = self.herbivore_species[animal.species]
-            
-            # Base metabolism cost (1 HP per turn + age factor)
-            base_cost = 1
-            # Use species specific multiplier if available, else global config
-            multiplier = species_data.get('metabolism_multiplier', HERBIVORE_CONFIG.get('metabolism_multiplier', 1.0))
-            
-            # Apply multiplier (probabilistic for fractional values)
-            cost_float = base_cost * multiplier
-            metabolism_cost = int(cost_float)
-            if np.random.random() < (cost_float - metabolism_cost):
-                metabolism_cost += 1
-            
-            # Mortality check (Old Age)
-            if animal.env_stats and animal.age > animal.env_stats.max_age:
-                # Chance to die increases with years past max age
-                over_age = animal.age - animal.env_stats.max_age
-                death_chance = 0.05 + (over_age * 0.02)
-                if np.random.random() < death_chance:
-                    animal.combat_stats.current_hp = 0
-                    animal.cause_of_death = 'old_age'
-                    continue
-            
-            # Legacy age penalty (keep for non-env stats animals if any)
-            elif animal.age > 40:  
-                metabolism_cost += 1
-            
-            # Environmental checks
-            if animal.env_stats:
-                # Temperature check
-                local_temp = climate_engine.world.temperature[animal.y, animal.x]
-                
-                # Cold stress
-                if local_temp < animal.env_stats.min_temp:
-                    diff = animal.env_stats.min_temp - local_temp
-                    damage = int(diff * 20) # Significant damage
-                    if animal.env_stats.cold_blooded:
-                        damage = int(damage * 2.0) # Cold blooded suffer double
-                    
-                    if damage > 0:
-                        animal.combat_stats.take_damage(damage)
-                        if not animal.is_alive() and animal.cause_of_death is None:
-                            animal.cause_of_death = 'cold'
-                
-                # Heat stress
-                if local_temp > animal.env_stats.max_temp:
-                    diff = local_temp - animal.env_stats.max_temp
-                    damage = int(diff * 20)
-                    if damage > 0:
-                        animal.combat_stats.take_damage(damage)
-                        if not animal.is_alive() and animal.cause_of_death is None:
-                            animal.cause_of_death = 'heat'
-
-            if animal.is_alive():
-                animal.combat_stats.take_damage(metabolism_cost)
-                if not animal.is_alive() and animal.cause_of_death is None:
-                    animal.cause_of_death = 'starvation'
-            
-            # Cooldown
-            if animal.reproductive_cooldown > 0:
-                animal.reproductive_cooldown -= 1
-        
-        # Behavior phase
-        new_offspring = []
-        for animal in self.herbivores:
-            if not animal.is_alive():
-                continue
-            
-            species_data = self.herbivore_species[animal.species]
-            
-            # 1. Movement decision
-            self._move_animal(animal, species_data, climate_engine, predator_map if predators_list else None)
-            
-            # Update spatial map after move (remove from old, add to new)
-            # Note: For strict correctness we should update the map, but for performance
-            # we can accept using the start-of-turn map for reproduction checks
-            # or just rebuild it if we really need to. 
-            # Actually, reproduction happens after movement, so using old map is slightly wrong.
-            # But rebuilding is expensive. Let's just use the old map for "nearby" checks
-            # since animals don't move far (1-2 tiles).
-            
-            # 2. Feeding
-            self._feed_animal(animal, species_data)
-            
-            # 3. Reproduction
-            if animal.can_reproduce():
-                offspring = self._reproduce_animal(animal, species_data)
-                if offspring:
-                    new_offspring.extend(offspring)
+        self._gather_state()
+        start_xs, start_ys = self.xs.copy(), self.ys.copy()
         
-        # Add new offspring
-        self.herbivores.extend(new_offspring)
-        
-        # Remove dead animals
-        initial_count = len(self.herbivores)
+        # Spatial map for fast neighbor lookups by predators and nomads
+        # Key: (x, y), Value: list of animals at the start of the turn
+        self.spatial_map = SpatialGrid(self.herbivores, start_xs, start_ys, self.width, self.height)
+        # Mates are looked up against everyone present at the start of the turn
+        occupancy = self._mate_occupancy(start_xs, start_ys)
+        self._update_metabolism(climate_engine)
         
-        # Collect death stats
+        # Drop this turn's metabolism deaths so the remaining passes only see the living
         self.recent_deaths = {}
-        dead_animals = [a for a in self.herbivores if not a.is_alive()]
-        for a in dead_animals:
-            cause = a.cause_of_death if a.cause_of_death else 'unknown'
-            if cause not in self.recent_deaths:
-                self.recent_deaths[cause] = 0
-            self.recent_deaths[cause] += 1
-            
-            if self.logger_callback:
-                self.logger_callback('death', a.species, details=cause)
-            
-        self.herbivores = [a for a in self.herbivores if a.is_alive()]
-        deaths = initial_count - len(self.herbivores)
+        live = self._remove_dead()
+        start_xs, start_ys = start_xs[live], start_ys[live]
+        
+        # Movement decision (all animals at once)
+        self._move_animals(predator_xs, predator_ys)
+        
+        # Feeding
+        self._feed_animals()
         
-        if deaths > 0:
-            # print(f"  💀 {deaths} herbivores died") # Suppress detailed print here, let simulation handle it
-            pass
+        # Reproduction, with mate availability against start-of-turn positions
+        has_mate = self._find_mates(occupancy, start_xs, start_ys)
+        new_offspring = self._reproduce_animals(has_mate)
+        
+        # Remove parents killed by the cost of reproduction, write back the
+        # survivors and add new offspring
+        self._remove_dead()
+        self._scatter_state()
+        self.herbivores.extend(new_offspring)
         
         # Track populations
-        for species_name in self.herbivore_species.keys():
-            count = sum(1 for a in self.herbivores if a.species == species_name)
-            self.population_history[species_name].append(count)
+        self._record_population()
+    
+    def _species_counts(self):
+        """Population per species id in a single pass"""
+        species_idx = np.fromiter((a.species_idx for a in self.herbivores), dtype=np.uint8,
+                                  count=len(self.herbivores))
+        return np.bincount(species_idx, minlength=len(SPECIES_NAMES))
+    
+    def _record_population(self):
+        """Append current per-species counts to the population history"""
+        if self._history_len == self._history.shape[1]:
+            self._history = np.concatenate([self._history, np.zeros_like(self._history)], axis=1)
+        self._history[:, self._history_len] = self._species_counts()
+        self._history_len += 1
     
-    def _move_animal(self, animal, species_data, climate_engine, predator_map=None):
-        """Decide if and where animal moves"""
-        movement_stats = animal.movement_stats
+    def _move_animals(self, predator_xs=None, predator_ys=None):
+        """Decide if and where every animal moves (the arrays hold only the living)"""
+        n = len(self.xs)
+        if n == 0:
+            return
         
-        # Check current location suitability
-        current_biome = self.world.biomes[animal.y, animal.x]
-        current_food = self.vegetation.density[animal.y, animal.x]
+        sid = self.species_idx
+        xs, ys = self.xs, self.ys
+        biomes = self.world.biomes
+        density = self.vegetation.density
         
         # Habitat quality based on terrain preference
-        biome_pref = movement_stats.terrain_preferences.get(current_biome, 0.3)
-        habitat_quality = biome_pref * (0.5 + 0.5 * current_food)
-        
-        # Check for predators nearby
-        nearby_predators = []
-        if predator_map:
-            scan_radius = 4
-            for dy in range(-scan_radius, scan_radius + 1):
-                for dx in range(-scan_radius, scan_radius + 1):
-                    nx = (animal.x + dx) % self.width
-                    ny = (animal.y + dy) % self.height
-                    if (nx, ny) in predator_map:
-                        nearby_predators.append((nx, ny))
-        
-        # Flee if predators are close
-        is_fleeing = len(nearby_predators) > 0
-        
-        # Move if habitat is poor or hungry OR fleeing
-        should_move = habitat_quality < 0.6 or animal.combat_stats.hp_percentage() < 0.6 or is_fleeing
-        
-        if should_move or np.random.random() < 0.3:
-            # Look for better location nearby
-            best_score = -999 if is_fleeing else habitat_quality
-            best_dx, best_dy = 0, 0
-            
-            # Scan radius based on movement range
-            scan_radius = movement_stats.movement_range
-            
-            for dy in range(-scan_radius, scan_radius + 1):
-                for dx in range(-scan_radius, scan_radius + 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    
-                    nx = (animal.x + dx) % self.width
-                    ny = (animal.y + dy) % self.height
-                    
-                    neighbor_biome = self.world.biomes[ny, nx]
-                    
-                    # Check for water traversal
-                    if not movement_stats.can_swim and neighbor_biome in [0, 1]:
-                        continue
-                        
-                    neighbor_food = self.vegetation.density[ny, nx]
-                    
-                    n_biome_pref = movement_stats.terrain_preferences.get(neighbor_biome, 0.3)
-                    
-                    # Distance penalty
-                    dist = np.sqrt(dx*dx + dy*dy)
-                    if dist > movement_stats.movement_range:
-                        continue
-                        
-                    dist_penalty = 1.0 / (1.0 + dist * 0.2)
-                    
-                    neighbor_quality = n_biome_pref * (0.5 + 0.5 * neighbor_food) * dist_penalty
-                    
-                    # Predator avoidance score
-                    predator_penalty = 0
-                    if is_fleeing:
-                        # Calculate distance to nearest predator from this potential spot
-                        min_pred_dist = 999
-                        for px, py in nearby_predators:
-                            # Simple distance (ignoring wrap for speed in this loop, or handle it?)
-                            # Let's just use simple euclidean for local avoidance
-                            p_dist = np.sqrt((nx - px)**2 + (ny - py)**2)
-                            if p_dist < min_pred_dist:
-                                min_pred_dist = p_dist
-                        
-                        # Reward being far from predators
-                        # If spot is closer than 2 units, massive penalty
-                        if min_pred_dist < 2:
-                            predator_penalty = 100
-                        else:
-                            # Bonus for distance
-                            neighbor_quality += min_pred_dist * 2
-                    
-                    final_score = neighbor_quality - predator_penalty
-                    
-                    if final_score > best_score:
-                        best_score = final_score
-                        best_dx, best_dy = dx, dy
-            
-            # Move to best location
-            if best_dx != 0 or best_dy != 0:
-                animal.move(best_dx, best_dy, self.width, self.height)
-                # Movement costs HP? Maybe small amount
-                # animal.combat_stats.take_damage(1)
+        food = 0.5 + 0.5 * density
+        habitat_quality = self.pref_lut[sid, biomes[ys, xs]] * food[ys, xs]
+        
+        # Per-species habitat quality field for this turn, as destination scores
+        destinations = (self._terrain_field() * food).ravel()
+        
+        # Check for predators nearby (wrapped 9x9 scan window)
+        is_fleeing = np.zeros(n, dtype=bool)
+        if predator_xs is not None:
+            is_fleeing = self._threat_field(predator_xs, predator_ys)[ys, xs]
+        
+        # Move if habitat is poor or hungry OR fleeing (or 30% of the time anyway)
+        should_move = ((habitat_quality < 0.6) | (self.hp < 0.6 * self.max_hp_lut[sid]) | is_fleeing |
+                       (self.rng.random(n) < 0.3))
+        
+        # Species sharing a movement range are scored together, each batch
+        # against only the candidate offsets within that range
+        mover_range = np.where(should_move, self.move_range_lut[sid], 0)
+        for move_range, (off_dx, off_dy, dist_penalty) in self._move_offsets.items():
+            range_movers = np.flatnonzero(mover_range == move_range)
+            for start in range(0, len(range_movers), MOVE_BLOCK_SIZE):
+                movers = range_movers[start:start + MOVE_BLOCK_SIZE]
+                self._move_batch(movers, destinations, off_dx, off_dy, dist_penalty, habitat_quality[movers],
+                                 is_fleeing[movers], predator_xs, predator_ys)
     
-    def _feed_animal(self, animal, species_data):
-        """Animal attempts to eat vegetation or insects"""
+    def _threat_field(self, predator_xs, predator_ys, scan_radius=PREDATOR_SCAN_RADIUS):
+        """Cells with a predator inside the wrapped (2r+1)^2 window around them"""
+        field = np.zeros((self.height, self.width), dtype=bool)
+        field[predator_ys, predator_xs] = True
+        
+        # Separable box maximum: spread along rows, then along columns
+        rows = field.copy()
+        for d in range(1, scan_radius + 1):
+            rows |= np.roll(field, d, axis=0) | np.roll(field, -d, axis=0)
+        field = rows.copy()
+        for d in range(1, scan_radius + 1):
+            field |= np.roll(rows, d, axis=1) | np.roll(rows, -d, axis=1)
+        return field
+    
+    def _predators_near(self, xs, ys, predator_xs, predator_ys, scan_radius=PREDATOR_SCAN_RADIUS):
+        """(animal, predator) mask of predators inside each animal's wrapped scan window"""
+        pdx = np.abs(xs[:, None] - predator_xs)
+        pdy = np.abs(ys[:, None] - predator_ys)
+        return ((np.minimum(pdx, self.width - pdx) <= scan_radius) &
+                (np.minimum(pdy, self.height - pdy) <= scan_radius))
+    
+    def _move_batch(self, movers, destinations, off_dx, off_dy, dist_penalty, habitat_quality, is_fleeing,
+                    predator_xs, predator_ys):
+        """Move each animal in the batch to its best scoring candidate cell"""
+        # Score every candidate cell around every mover with one gather from
+        # the flattened per-species destination field
+        m_sid = self.species_idx[movers].astype(np.intp)[:, None]
+        nx = self._wrap_x[self.xs[movers].astype(np.intp)[:, None] + (off_dx + self.width)]
+        ny = self._wrap_y[self.ys[movers].astype(np.intp)[:, None] + (off_dy + self.height)]
+        score = destinations.take((m_sid * self.height + ny) * self.width + nx) * dist_penalty
+        
+        # Predator avoidance: reward distance from the nearest nearby predator,
+        # massive penalty for spots closer than 2 units
+        fleeing = np.flatnonzero(is_fleeing)
+        if len(fleeing):
+            # Only (animal, predator) pairs inside the scan window; every fleeing
+            # animal has at least one, so pairs group into one run per animal
+            near = self._predators_near(self.xs[movers[fleeing]], self.ys[movers[fleeing]],
+                                        predator_xs, predator_ys)
+            pair_f, pair_p = np.nonzero(near)
+            p_dist = np.hypot(nx[fleeing][pair_f] - predator_xs[pair_p][:, None],
+                              ny[fleeing][pair_f] - predator_ys[pair_p][:, None])
+            starts = np.flatnonzero(np.r_[True, pair_f[1:] != pair_f[:-1]])
+            min_pred_dist = np.minimum.reduceat(p_dist, starts, axis=0)
+            score[fleeing] = np.where(min_pred_dist < 2, score[fleeing] - 100,
+                                      score[fleeing] + min_pred_dist * 2)
+        
+        best = score.argmax(axis=1)
+        rows = np.arange(len(movers))
+        
+        # Move to best location if it beats staying put
+        baseline = np.where(is_fleeing, -999, habitat_quality)
+        moved = score[rows, best] > baseline
+        self.xs[movers[moved]] = nx[rows, best][moved]
+        self.ys[movers[moved]] = ny[rows, best][moved]
+    
+    def _feed_animals(self):
+        """Animals eat insects (frogs) or vegetation"""
+        sid = self.species_idx
+        grazing = np.ones(len(sid), dtype=bool)
+        
         # Insectivores (like frogs) eat insects if available
-        if animal.species == 'frog' and self.ecology and self.ecology.insects:
-            # Try to eat 2000 insects
-            consumed_density = self.ecology.insects.consume(animal.x, animal.y, amount=2000)
-            
-            # Convert back to count to check if it was enough
-            # Note: max_density_per_tile is 10 Billion
-            count_consumed = consumed_density * self.ecology.insects.max_density_per_tile
-            
-            if count_consumed > 500: # At least 500 insects
-                # Boost energy gain to ensure survival (0.3 = 1.5 HP for 5 Max HP -> 1-2 HP gain)
-                animal.gain_energy(0.3)
-                return
-
-        veg_density = self.vegetation.density[animal.y, animal.x]
+        if self.ecology and self.ecology.insects:
+            frogs = np.flatnonzero(grazing & (sid == SPECIES_INDEX['frog']))
+            insects = self.ecology.insects
+            # Try to eat 2000 insects each
+            consumed_density = insects.consume_batch(self.xs[frogs], self.ys[frogs], amount=2000)
+            
+            # Convert back to count to check if it was enough (at least 500 insects)
+            fed = frogs[consumed_density * insects.max_density_per_tile > 500]
+            # Boost energy gain to ensure survival (0.3 = 1.5 HP for 5 Max HP -> 1-2 HP gain)
+            self._gain_energy(fed, 0.3)
+            grazing[fed] = False
+        
+        # Animals sharing a cell eat one after another, in random order
+        eaters = np.flatnonzero(grazing)
+        eaters = self.rng.permutation(eaters)
+        cell_ids = self.ys[eaters].astype(np.intp) * self.width + self.xs[eaters]
+        order = np.argsort(cell_ids, kind='stable')
+        eaters, cell_ids = eaters[order], cell_ids[order]
         
-        # Use combat resolver for feeding
-        consumed = self.combat_resolver.resolve_herbivore_feeding(
-            animal, veg_density, species_data
+        # Use combat resolver for feeding (the density grid is C-contiguous, so
+        # its flat view writes through)
+        density = self.vegetation.density.ravel()
+        max_hp = self.max_hp_lut[sid[eaters]]
+        consumed, hp_gained = self.combat_resolver.resolve_herbivore_feeding_batch(
+            self.hp[eaters], max_hp, density[cell_ids], cell_ids
         )
         
-        if consumed > 0:
-            self.vegetation.density[animal.y, animal.x] -= consumed
+        self.hp[eaters] = np.minimum(max_hp, self.hp[eaters] + hp_gained)
+        np.subtract.at(density, cell_ids, consumed)
     
-    def _reproduce_animal(self, animal, species_data):
-        """Animal produces offspring"""
-        # Check for nearby mates using spatial map
-        mate_nearby = False
+    def _gain_energy(self, idx, amount):
+        """Vectorized Animal.gain_energy for the animals at idx"""
+        max_hp = self.max_hp_lut[self.species_idx[idx]]
+        heal_float = amount * max_hp
+        heal = heal_float.astype(int)
+        heal += self.rng.random(len(idx)) < (heal_float - heal)
+        self.hp[idx] = np.minimum(max_hp, self.hp[idx] + heal)
+    
+    def _mate_occupancy(self, start_xs, start_ys):
+        """Spatial hash: occupancy count per (species, cell) from start-of-turn positions"""
+        num_species = len(SPECIES_NAMES)
+        cell_ids = (self.species_idx.astype(np.intp) * self.height + start_ys) * self.width + start_xs
+        occupancy = np.bincount(cell_ids, minlength=num_species * self.height * self.width).astype(np.int32)
+        return occupancy.reshape(num_species, self.height, self.width)
+    
+    def _find_mates(self, occupancy, start_xs, start_ys):
+        """Flag animals with another member of their species within the search window"""
         search_radius = 3
         
-        # Check cells in radius
-        for dy in range(-search_radius, search_radius + 1):
-            for dx in range(-search_radius, search_radius + 1):
-                nx = (animal.x + dx) % self.width
-                ny = (animal.y + dy) % self.height
-                
-                if (nx, ny) in self.spatial_map:
-                    for other in self.spatial_map[(nx, ny)]:
-                        if other.species == animal.species and other is not animal:
-                            mate_nearby = True
-                            break
-                if mate_nearby:
-                    break
-            if mate_nearby:
-                break
+        # Same-species count in the wrapped (2r+1)^2 window around every cell:
+        # a separable box sum of shifted slices over the wrap-padded grid
+        r, height, width = search_radius, self.height, self.width
+        padded = np.pad(occupancy, ((0, 0), (r, r), (r, r)), mode='wrap')
+        rows = padded[:, :height].copy()
+        for k in range(1, 2 * r + 1):
+            rows += padded[:, k:k + height]
+        window = rows[:, :, :width].copy()
+        for k in range(1, 2 * r + 1):
+            window += rows[:, :, k:k + width]
+        
+        # One lookup per animal at its current position
+        nearby = window[self.species_idx, self.ys, self.xs]
+        
+        # Don't count the animal itself if its start-of-turn cell is inside the window
+        sdx = np.abs(self.xs - start_xs)
+        sdy = np.abs(self.ys - start_ys)
+        nearby -= ((np.minimum(sdx, self.width - sdx) <= search_radius) &
+                   (np.minimum(sdy, self.height - sdy) <= search_radius))
+        return nearby > 0
+    
+    def _reproduce_animals(self, has_mate):
+        """Animals with a mate nearby produce offspring; returns the new Animal objects"""
+        sid = self.species_idx
+        parents = np.flatnonzero((self.hp >= self.repro_threshold_lut[sid]) &
+                                 (self.cooldown == 0) & (self.age > 8) &  # Increased age requirement
+                                 has_mate)
+        parent_sid = sid[parents]
+        
+        # Every potential offspring has an 80% survival chance
+        litters = np.repeat(parents, self.offspring_lut[parent_sid])
+        born = litters[self.rng.random(len(litters)) < 0.8]
+        
+        # Reproduction cost (HP), same rules as CombatStats.take_damage
+        cost = self.repro_cost_lut[parent_sid]
+        self.hp[parents] -= np.minimum(np.maximum(1, cost - self.defense_lut[parent_sid]), self.hp[parents])
+        self.cooldown[parents] = 6
         
         offspring_list = []
-        if mate_nearby:
-            offspring_count = species_data.get('offspring_count', 1)
-            
-            for _ in range(offspring_count):
-                if np.random.random() < 0.8:  # 80% survival
-                    offspring = Animal(animal.x, animal.y, animal.species)
-                    # Offspring start with 50% HP
-                    offspring.combat_stats.current_hp = int(offspring.combat_stats.max_hp * 0.5)
-                    offspring_list.append(offspring)
-            
-            # Reproduction cost (HP)
-            cost = int(animal.combat_stats.max_hp * 0.3)
-            animal.combat_stats.take_damage(cost)
-            animal.reproductive_cooldown = 6
-            
+        # Offspring start with 50% HP
+        for x, y, s, hp in zip(self.xs[born].tolist(), self.ys[born].tolist(), sid[born].tolist(),
+                               self.newborn_hp_lut[sid[born]].tolist()):
+            offspring = Animal(x, y, SPECIES_NAMES[s])
+            offspring.combat_stats.current_hp = hp
+            offspring_list.append(offspring)
+        
         return offspring_list
     
     def get_population_counts(self):
         """Return current population by species"""
-        counts = {species: 0 for species in self.herbivore_species.keys()}
-        for animal in self.herbivores:
-            counts[animal.species] += 1
-        return counts
+        return dict(zip(SPECIES_NAMES, self._species_counts().tolist()))
     
     def visualize(self, show_populations=True):
         """Display animal distribution and population graphs"""
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import to_rgba_array
+        
+        species_colors = {
+            'deer': 'brown',
+            'bison': 'darkred',
+            'caribou': 'gray',
+            'gazelle': 'orange',
+            'elephant': 'purple',
+            'rabbit': 'white'
+        }
+        
+        # All animals go in a single scatter, colored per point from a species id table
+        self._gather_state()
+        color_lut = to_rgba_array([species_colors.get(species, 'black') for species in SPECIES_NAMES])
+        point_colors = color_lut[self.species_idx]
+        
         if show_populations:
             fig = plt.figure(figsize=(15, 10))
             gs = fig.add_gridspec(2, 2, height_ratios=[2, 1])
@@ -463,18 +688,7 @@ class AnimalSystem:
             ax_map.imshow(self.vegetation.density, cmap='YlGn', alpha=0.6, vmin=0, vmax=1)
             
             # Overlay animals
-            species_colors = {
-                'deer': 'brown',
-                'bison': 'darkred',
-                'caribou': 'gray',
-                'gazelle': 'orange',
-                'elephant': 'purple',
-                'rabbit': 'white'
-            }
-            
-            for animal in self.herbivores:
-                color = species_colors.get(animal.species, 'black')
-                ax_map.plot(animal.x, animal.y, 'o', color=color, markersize=3, alpha=0.7)
+            ax_map.scatter(self.xs, self.ys, c=point_colors, s=9, alpha=0.7, marker='o', linewidths=0)
             
             ax_map.set_title('Animal Distribution (vegetation density shown)')
             ax_map.axis('off')
@@ -486,18 +700,19 @@ class AnimalSystem:
             # Split species across two graphs for readability
             species_list = list(self.herbivore_species.keys())
             mid = len(species_list) // 2
+            history = self._history[:, :self._history_len]
             
             for i, species in enumerate(species_list[:mid]):
-                if len(self.population_history[species]) > 0:
-                    ax_pop1.plot(self.population_history[species], 
+                if self._history_len > 0:
+                    ax_pop1.plot(history[SPECIES_INDEX[species]], 
                                label=species.capitalize(), 
-                               color=species_colors[species])
+                               color=species_colors.get(species, 'black'))
             
             for species in species_list[mid:]:
-                if len(self.population_history[species]) > 0:
-                    ax_pop2.plot(self.population_history[species], 
+                if self._history_len > 0:
+                    ax_pop2.plot(history[SPECIES_INDEX[species]], 
                                label=species.capitalize(),
-                               color=species_colors[species])
+                               color=species_colors.get(species, 'black'))
             
             ax_pop1.set_xlabel('Turn')
             ax_pop1.set_ylabel('Population')
@@ -517,15 +732,7 @@ class AnimalSystem:
             # Simple map view
             plt.figure(figsize=(12, 8))
             plt.imshow(self.vegetation.density, cmap='YlGn', alpha=0.6)
-            
-            species_colors = {
-                'deer': 'brown', 'bison': 'darkred', 'caribou': 'gray',
-                'gazelle': 'orange', 'elephant': 'purple', 'rabbit': 'white'
-            }
-            
-            for animal in self.herbivores:
-                color = species_colors.get(animal.species, 'black')
-                plt.plot(animal.x, animal.y, 'o', color=color, markersize=3, alpha=0.7)
+            plt.scatter(self.xs, self.ys, c=point_colors, s=9, alpha=0.7, marker='o', linewidths=0)
             
             plt.title('Herbivore Distribution')
             plt.axis('off')
@@ -533,34 +740,24 @@ class AnimalSystem:
     
     def spawn_migrants(self, species_name, count=5):
         """Spawn new individuals at map edges (migration)"""
-        spawned = 0
-        attempts = 0
-        max_attempts = count * 10
-        
-        species_data = self.herbivore_species[species_name]
-        movement_stats = species_data['movement']
-        preferred_biomes = [b for b, m in movement_stats.terrain_preferences.items() if m >= 0.6]
-        
-        while spawned < count and attempts < max_attempts:
-            attempts += 1
-            # Pick an edge
-            if np.random.random() < 0.5:
-                x = np.random.choice([0, self.width - 1])
-                y = np.random.randint(0, self.height)
-            else:
-                x = np.random.randint(0, self.width)
-                y = np.random.choice([0, self.height - 1])
-            
-            biome = self.world.biomes[y, x]
-            veg_density = self.vegetation.density[y, x]
-            
-            # Check if location is suitable
-            if (biome in preferred_biomes and veg_density > 0.1):
-                animal = Animal(x, y, species_name)
-                # Migrants are usually healthy
-                animal.combat_stats.current_hp = int(animal.combat_stats.max_hp * 0.9)
-                self.herbivores.append(animal)
-                spawned += 1
+        # Suitable locations: map edge, acceptable biome (terrain preference of 0.6 or better)
+        # with vegetation
+        preferred = self.pref_lut[SPECIES_INDEX[species_name]] >= 0.6
+        edge = np.zeros((self.height, self.width), dtype=bool)
+        edge[[0, -1], :] = True
+        edge[:, [0, -1]] = True
+        suitable = (edge & preferred[self.world.biomes] & (self.vegetation.density > 0.1)).ravel()
+        
+        # Up to 10 random edge cells per migrant; the first suitable ones are kept
+        tries = self.rng.choice(np.flatnonzero(edge), size=count * 10)
+        picks = tries[suitable[tries]][:count]
+        spawned = len(picks)
+        ys, xs = np.divmod(picks, self.width)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            animal = Animal(x, y, species_name)
+            # Migrants are usually healthy
+            animal.combat_stats.current_hp = int(animal.combat_stats.max_hp * 0.9)
+            self.herbivores.append(animal)
         
         if spawned > 0:
             print(f"  🦌 {spawned} {species_name} migrated into the area")
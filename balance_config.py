@@ -1,10 +1,19 @@
 """
 Balance configuration for ecosystem stability.
 Adjust these values to prevent collapse and create stable population cycles.
+
+The config tables are read-only mappings so systems can safely fold them
+into their own lookup tables at construction time.
 """
 
+import copy
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
 # === VEGETATION BALANCE ===
-VEGETATION_CONFIG = {
+VEGETATION_CONFIG = MappingProxyType({
     # Growth rates per biome (base values in vegetation_system.py will be multiplied by these)
     'growth_multiplier': 1.5,  # Global growth speed boost
     
@@ -12,15 +21,15 @@ VEGETATION_CONFIG = {
     'initial_density_boost': 1.3,  # Start with more established vegetation
     
     # Biome-specific adjustments
-    'biome_adjustments': {
+    'biome_adjustments': MappingProxyType({
         5: 1.2,  # Grassland - extra boost (prime herbivore habitat)
         6: 1.3,  # Rainforest - extra boost
         7: 1.2,  # Temperate Forest - boost
-    }
-}
+    })
+})
 
 # === HERBIVORE BALANCE ===
-HERBIVORE_CONFIG = {
+HERBIVORE_CONFIG = MappingProxyType({
     # Metabolism (energy consumed per turn)
     'metabolism_multiplier': 0.6,  # Reduce by 40% (live longer without food)
     
@@ -37,10 +46,10 @@ HERBIVORE_CONFIG = {
     
     # Initial spawn
     'spawn_energy_range': (0.8, 1.0),  # Start with more energy (was 0.5-0.8)
-}
+})
 
 # === PREDATOR BALANCE ===
-PREDATOR_CONFIG = {
+PREDATOR_CONFIG = MappingProxyType({
     # Hunting
     'hunt_success_multiplier': 0.7,  # Slightly less successful hunts
     'hunt_cooldown_multiplier': 1.5,  # Longer rest after kills
@@ -54,10 +63,10 @@ PREDATOR_CONFIG = {
     
     # Population control
     'max_population_per_species': 25,  # Cap predators to prevent over-hunting
-}
+})
 
 # === SPAWNING BALANCE ===
-SPAWN_CONFIG = {
+SPAWN_CONFIG = MappingProxyType({
     # Establishment phases
     'vegetation_establishment_years': 8,  # More time for plants (was 5)
     'herbivore_establishment_years': 5,   # More time before predators (was 3)
@@ -73,10 +82,10 @@ SPAWN_CONFIG = {
     # Spawn quality checks
         'herbivore_min_vegetation': 0.5,  # Increased from 0.15 to prevent instant starvation
     'predator_min_prey_nearby': 5,     # Must have prey nearby to spawn
-}
+})
 
 # === ECOLOGY BALANCE ===
-ECOLOGY_CONFIG = {
+ECOLOGY_CONFIG = MappingProxyType({
     # Event frequencies (reduce chaos during establishment)
     'disease_frequency': 0.01,   # Reduce from 0.02
     'disaster_frequency': 0.005, # Reduce from 0.01
@@ -88,10 +97,10 @@ ECOLOGY_CONFIG = {
     # Scavenger adjustments
     'scavenger_metabolism': 0.05,  # Even lower (was 0.06)
     'carrion_decay_rate': 0.9,     # Slower decay (more food available)
-}
+})
 
 # === CLIMATE BALANCE ===
-CLIMATE_CONFIG = {
+CLIMATE_CONFIG = MappingProxyType({
     # Seasonal variation (reduce stress during establishment)
     'seasonal_temperature_shift': 0.8,  # Less extreme seasons
     'seasonal_moisture_shift': 0.8,
@@ -99,7 +108,7 @@ CLIMATE_CONFIG = {
     # Weather events
     'storm_spawn_multiplier': 0.7,   # Fewer storms
     'drought_spawn_multiplier': 0.7,  # Fewer droughts
-}
+})
 
 
 def apply_balance_to_game(game_state):
@@ -112,12 +121,16 @@ def apply_balance_to_game(game_state):
     # === Apply Vegetation Balance ===
     veg = game_state.vegetation
     veg.density *= VEGETATION_CONFIG['initial_density_boost']
-    veg.density = veg.density.clip(0, 1)
+    np.clip(veg.density, 0, 1, out=veg.density)
     
-    for biome_id, multiplier in VEGETATION_CONFIG['biome_adjustments'].items():
-        mask = game_state.world.biomes == biome_id
-        veg.density[mask] *= multiplier
-        veg.density = veg.density.clip(0, 1)
+    # Per-biome multipliers as a lookup table, applied in one pass
+    biomes = game_state.world.biomes
+    adjustments = VEGETATION_CONFIG['biome_adjustments']
+    biome_multiplier = np.ones(max(int(biomes.max()), *adjustments) + 1)
+    for biome_id, multiplier in adjustments.items():
+        biome_multiplier[biome_id] = multiplier
+    veg.density *= biome_multiplier[biomes]
+    np.clip(veg.density, 0, 1, out=veg.density)
     
     # Boost growth rates
     for biome_id in veg.biome_growth_rates:
@@ -135,6 +148,13 @@ def apply_balance_to_game(game_state):
 
 def get_balanced_world_config():
     """Return a WorldConfig with balanced initial populations"""
+    # Callers are free to tweak the returned config, so hand out a copy of the cached one
+    return copy.copy(_balanced_world_config())
+
+
+@lru_cache(maxsize=1)
+def _balanced_world_config():
+    """Build the balanced WorldConfig once; the inputs are all module constants"""
     from game_controller import WorldConfig
     config = WorldConfig()
     config.herbivore_population = SPAWN_CONFIG['herbivore_per_species']
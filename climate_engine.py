@@ -1,11 +1,53 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
 from matplotlib.colors import LinearSegmentedColormap
 from terrain_generator import WorldGenerator
 
+SEASON_NAMES = ("Spring", "Summer", "Fall", "Winter")
+
+# Column layout of the active weather event stores (one array per field)
+STORM_FIELDS = {'x': np.intp, 'y': np.intp, 'intensity': np.float64,
+                'radius': np.intp, 'duration': np.intp, 'type': '<U12'}
+DROUGHT_FIELDS = {'x': np.intp, 'y': np.intp, 'severity': np.float64,
+                  'radius': np.intp, 'duration': np.intp}
+
+
+def _empty_events(fields):
+    """Create an empty structure-of-arrays event store"""
+    return {key: np.empty(0, dtype=dtype) for key, dtype in fields.items()}
+
+
+def _events_to_dicts(events):
+    """Expand an event store into the list-of-dicts form used by callers"""
+    keys = list(events)
+    return [dict(zip(keys, row)) for row in zip(*(events[k].tolist() for k in keys))]
+
+
+def _events_from_dicts(dicts, fields):
+    """Pack a list of event dicts into a structure-of-arrays event store"""
+    return {key: np.array([d[key] for d in dicts], dtype=dtype)
+            for key, dtype in fields.items()}
+
+
+def _append_events(events, **columns):
+    """Append a batch of events (one array per field) to a store"""
+    for key, column in columns.items():
+        events[key] = np.concatenate((events[key], column)).astype(events[key].dtype, copy=False)
+
+
+def _drop_expired(events):
+    """Remove events whose duration has run out"""
+    keep = events['duration'] > 0
+    for key in events:
+        events[key] = events[key][keep]
+
 class ClimateEngine:
-    def __init__(self, world_generator):
+    def __init__(self, world_generator, verbose=True, headless=False):
         self.world = world_generator
+        self.verbose = verbose  # Print season banners and weather event messages
+        self.headless = headless  # Skip visualize_climate entirely (benchmarks, servers)
+        self._figure = None  # Built lazily by visualize_climate and reused afterwards
         self.width = world_generator.width
         self.height = world_generator.height
         
@@ -14,18 +56,57 @@ class ClimateEngine:
         self.season = 0  # 0=Spring, 1=Summer, 2=Fall, 3=Winter
         self.year = 0
         
+        # Weather RNG, seeded from the global stream so np.random.seed() still reproduces runs
+        self.rng = np.random.default_rng(np.random.randint(0, 2**31))
+        
+        # Climate grids are rewritten every turn; float32 is ample for [0, 1] values
+        self.world.temperature = self.world.temperature.astype(np.float32)
+        self.world.moisture = self.world.moisture.astype(np.float32)
+        
         # Store base values (unchanging foundation)
         self.base_temperature = self.world.temperature.copy()
         self.base_moisture = self.world.moisture.copy()
         
-        # Active weather systems
-        self.storms = []  # List of active storm systems
-        self.droughts = []  # List of drought zones
+        # Distance from the equator (0) to the poles (1) per row, broadcast across columns
+        latitude_factor = (np.abs(np.arange(self.height) - self.height / 2) / (self.height / 2))[:, None].astype(np.float32)
+        
+        # Per-season shifts that only depend on latitude/elevation, indexed by season
+        # Summer: warmer everywhere, especially at poles; Winter: colder, especially at poles
+        self._temp_shifts = (0.0, 0.15 + (latitude_factor * 0.2), 0.0, -0.15 - (latitude_factor * 0.3))
+        # Spring: increased rainfall; Summer: drier inland, more so at high elevation; Fall: moderate rainfall
+        self._moisture_shifts = (0.1, np.where(self.world.elevation > 0.5, np.float32(-0.15), np.float32(-0.05)), 0.05)
+        
+        # Scratch grids reused every turn (seasonal noise, winter cold-cell mask)
+        self._season_noise = np.empty((self.height, self.width), dtype=np.float32)
+        self._cold_mask = np.empty((self.height, self.width), dtype=bool)
+        
+        # Active weather systems, stored as parallel arrays (see STORM_FIELDS/DROUGHT_FIELDS)
+        self._storms = _empty_events(STORM_FIELDS)
+        self._droughts = _empty_events(DROUGHT_FIELDS)
+        self._disk_cache = {}  # radius -> (dy, dx, falloff) disk offsets
         
         # Weather event thresholds
         self.storm_threshold = 0.85  # High moisture + temp differential
         self.drought_threshold = 0.15  # Very low moisture
         
+    @property
+    def storms(self):
+        """Active storm systems as a list of dicts"""
+        return _events_to_dicts(self._storms)
+    
+    @storms.setter
+    def storms(self, storms):
+        self._storms = _events_from_dicts(storms, STORM_FIELDS)
+    
+    @property
+    def droughts(self):
+        """Active drought zones as a list of dicts"""
+        return _events_to_dicts(self._droughts)
+    
+    @droughts.setter
+    def droughts(self, droughts):
+        self._droughts = _events_from_dicts(droughts, DROUGHT_FIELDS)
+    
     def advance_turn(self):
         """Progress time by one turn (one season)"""
         self.current_turn += 1
@@ -33,7 +114,8 @@ class ClimateEngine:
         if self.season == 0:
             self.year += 1
         
-        print(f"\n=== Year {self.year}, {self._season_name()} ===")
+        if self.verbose:
+            print(f"\n=== Year {self.year}, {self._season_name()} ===")
         
         # Update climate based on season
         self._apply_seasonal_shift()
@@ -44,7 +126,7 @@ class ClimateEngine:
         self._process_droughts()
         
     def _season_name(self):
-        return ["Spring", "Summer", "Fall", "Winter"][self.season]
+        return SEASON_NAMES[self.season]
     
     def _apply_seasonal_shift(self):
         """Modify temperature and moisture based on current season"""
@@ -52,199 +134,243 @@ class ClimateEngine:
         # Summer: +warmth in north, ++warmth in south
         # Winter: --cold in north, -cold in south
         
-        for y in range(self.height):
-            latitude_factor = abs(y - self.height/2) / (self.height/2)
-            
-            for x in range(self.width):
-                base_temp = self.base_temperature[y, x]
-                base_moist = self.base_moisture[y, x]
-                
-                # Temperature modulation
-                if self.season == 1:  # Summer
-                    # Warmer everywhere, especially at poles
-                    temp_shift = 0.15 + (latitude_factor * 0.2)
-                elif self.season == 3:  # Winter
-                    # Colder everywhere, especially at poles
-                    temp_shift = -0.15 - (latitude_factor * 0.3)
-                else:  # Spring/Fall
-                    # Moderate temperatures
-                    temp_shift = 0.0
-                
-                self.world.temperature[y, x] = np.clip(base_temp + temp_shift, 0, 1)
-                
-                # Moisture modulation (seasonal rainfall patterns)
-                if self.season == 0:  # Spring - increased rainfall
-                    moist_shift = 0.1
-                elif self.season == 1:  # Summer - drier inland
-                    if self.world.elevation[y, x] > 0.5:  # High elevation
-                        moist_shift = -0.15
-                    else:
-                        moist_shift = -0.05
-                elif self.season == 2:  # Fall - moderate rainfall
-                    moist_shift = 0.05
-                else:  # Winter - snow/rain depending on temp
-                    if self.world.temperature[y, x] < 0.3:
-                        moist_shift = 0.1  # Snow accumulation
-                    else:
-                        moist_shift = 0.0
-                
-                self.world.moisture[y, x] = np.clip(base_moist + moist_shift, 0, 1)
+        season = self.season
+        
+        # Temperature modulation (Spring/Fall: moderate temperatures, no shift)
+        temp_shift = self._temp_shifts[season]
+        
+        # Write straight into the live grids so the turn allocates no new climate arrays
+        temperature = self.world.temperature
+        moisture = self.world.moisture
+        np.add(self.base_temperature, temp_shift, out=temperature)
+        np.clip(temperature, 0, 1, out=temperature)
+        
+        # Moisture modulation (seasonal rainfall patterns)
+        if season == 3:  # Winter - snow accumulation where cold, otherwise unchanged
+            cold = np.less(temperature, 0.3, out=self._cold_mask)
+            np.copyto(moisture, self.base_moisture)
+            np.add(self.base_moisture, np.float32(0.1), out=moisture, where=cold)
+        else:
+            np.add(self.base_moisture, self._moisture_shifts[season], out=moisture)
+        np.clip(moisture, 0, 1, out=moisture)
         
         # Add seasonal noise variation
-        season_noise = np.random.randn(self.height, self.width) * 0.03
-        self.world.temperature += season_noise
-        self.world.moisture += season_noise
+        season_noise = self._season_noise
+        self.rng.standard_normal(dtype=season_noise.dtype, out=season_noise)
+        season_noise *= 0.03
+        temperature += season_noise
+        moisture += season_noise
         
-        self.world.temperature = np.clip(self.world.temperature, 0, 1)
-        self.world.moisture = np.clip(self.world.moisture, 0, 1)
+        np.clip(temperature, 0, 1, out=temperature)
+        np.clip(moisture, 0, 1, out=moisture)
     
     def _generate_weather_events(self):
         """Spawn storms and droughts based on atmospheric conditions"""
         # Clear old events
-        self.storms = [s for s in self.storms if s['duration'] > 0]
-        self.droughts = [d for d in self.droughts if d['duration'] > 0]
+        _drop_expired(self._storms)
+        _drop_expired(self._droughts)
         
         # Scan for storm conditions (high moisture + temperature differential)
-        for _ in range(np.random.randint(1, 4)):  # 1-3 potential storms per turn
-            y = np.random.randint(0, self.height)
-            x = np.random.randint(0, self.width)
-            
-            if self.world.moisture[y, x] > self.storm_threshold:
-                # Check for temperature gradient nearby (instability)
-                local_temp = self.world.temperature[max(0,y-2):min(self.height,y+3), 
-                                                     max(0,x-2):min(self.width,x+3)]
-                temp_variance = np.std(local_temp)
-                
-                if temp_variance > 0.1:  # Significant gradient = storm potential
-                    storm = {
-                        'x': x,
-                        'y': y,
-                        'intensity': np.random.uniform(0.5, 1.0),
-                        'radius': np.random.randint(3, 8),
-                        'duration': np.random.randint(1, 3),  # Lasts 1-3 turns
-                        'type': 'hurricane' if self.world.temperature[y, x] > 0.7 else 'thunderstorm'
-                    }
-                    self.storms.append(storm)
-                    print(f"  🌀 {storm['type'].capitalize()} forming at ({x}, {y})")
+        n = self.rng.integers(1, 4)  # 1-3 potential storms per turn
+        ys = self.rng.integers(0, self.height, n)
+        xs = self.rng.integers(0, self.width, n)
+        wet = self.world.moisture[ys, xs] > self.storm_threshold
+        ys, xs = ys[wet], xs[wet]
+        
+        # Check for temperature gradient nearby (instability)
+        unstable = self._local_temperature_std(ys, xs) > 0.1  # Significant gradient = storm potential
+        ys, xs = ys[unstable], xs[unstable]
+        if len(ys):
+            k = len(ys)
+            types = np.where(self.world.temperature[ys, xs] > 0.7, 'hurricane', 'thunderstorm')
+            _append_events(
+                self._storms,
+                x=xs,
+                y=ys,
+                intensity=self.rng.uniform(0.5, 1.0, k),
+                radius=self.rng.integers(3, 8, k),
+                duration=self.rng.integers(1, 3, k),  # Lasts 1-3 turns
+                type=types
+            )
+            if self.verbose:
+                for storm_type, x, y in zip(types.tolist(), xs.tolist(), ys.tolist()):
+                    print(f"  🌀 {storm_type.capitalize()} forming at ({x}, {y})")
         
         # Scan for drought conditions (very low moisture in non-water areas)
-        for _ in range(np.random.randint(0, 2)):  # 0-2 potential droughts
-            y = np.random.randint(0, self.height)
-            x = np.random.randint(0, self.width)
-            
-            if (self.world.moisture[y, x] < self.drought_threshold and 
-                self.world.elevation[y, x] > 0.4):  # Land only
-                drought = {
-                    'x': x,
-                    'y': y,
-                    'severity': 1.0 - self.world.moisture[y, x],
-                    'radius': np.random.randint(5, 12),
-                    'duration': np.random.randint(2, 5)  # Droughts last longer
-                }
-                self.droughts.append(drought)
-                print(f"  ☀️ Drought beginning at ({x}, {y})")
+        n = self.rng.integers(0, 2)  # 0-1 potential droughts
+        ys = self.rng.integers(0, self.height, n)
+        xs = self.rng.integers(0, self.width, n)
+        candidate = ((self.world.moisture[ys, xs] < self.drought_threshold) &
+                     (self.world.elevation[ys, xs] > 0.4))  # Land only
+        
+        ys, xs = ys[candidate], xs[candidate]
+        if len(ys):
+            k = len(ys)
+            _append_events(
+                self._droughts,
+                x=xs,
+                y=ys,
+                severity=1.0 - self.world.moisture[ys, xs],
+                radius=self.rng.integers(5, 12, k),
+                duration=self.rng.integers(2, 5, k)  # Droughts last longer
+            )
+            if self.verbose:
+                for x, y in zip(xs.tolist(), ys.tolist()):
+                    print(f"  ☀️ Drought beginning at ({x}, {y})")
+    
+    def _local_temperature_std(self, ys, xs):
+        """Temperature std over the 5x5 window around each cell, clipped at the map edges"""
+        if len(ys) == 0:
+            return np.empty(0)
+        # NaN padding drops out-of-map cells from the window, matching an edge-clipped slice
+        padded = np.pad(self.world.temperature, 2, constant_values=np.nan)
+        offsets = np.arange(5)
+        windows = padded[ys[:, None, None] + offsets[:, None], xs[:, None, None] + offsets]
+        return np.nanstd(windows, axis=(1, 2))
+    
+    def _disk(self, radius):
+        """Cached (dy, dx, falloff) offsets covering a disk of the given radius"""
+        if radius not in self._disk_cache:
+            dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+            dist = np.sqrt(dx*dx + dy*dy)
+            mask = dist <= radius
+            falloff = 1.0 - (dist[mask] / radius)
+            self._disk_cache[radius] = (dy[mask], dx[mask], falloff)
+        return self._disk_cache[radius]
+    
+    def _expand_disks(self, xs, ys, radii, strengths):
+        """Wrapped cells (ny, nx) of every event's disk, with strength * falloff per cell"""
+        ny, nx, weight = [], [], []
+        for x, y, radius, strength in zip(xs.tolist(), ys.tolist(), radii.tolist(), strengths.tolist()):
+            dy, dx, falloff = self._disk(radius)
+            ny.append((y + dy) % self.height)
+            nx.append((x + dx) % self.width)
+            weight.append(strength * falloff)
+        return np.concatenate(ny), np.concatenate(nx), np.concatenate(weight)
     
     def _process_storms(self):
         """Apply storm effects to affected areas"""
-        for storm in self.storms:
-            # Increase moisture in storm area
-            for dy in range(-storm['radius'], storm['radius'] + 1):
-                for dx in range(-storm['radius'], storm['radius'] + 1):
-                    dist = np.sqrt(dx*dx + dy*dy)
-                    if dist <= storm['radius']:
-                        ny = (storm['y'] + dy) % self.height
-                        nx = (storm['x'] + dx) % self.width
-                        
-                        # Moisture boost (rainfall)
-                        falloff = 1.0 - (dist / storm['radius'])
-                        moisture_increase = storm['intensity'] * 0.3 * falloff
-                        self.world.moisture[ny, nx] = min(1.0, 
-                            self.world.moisture[ny, nx] + moisture_increase)
-                        
-                        # Slight temperature drop (cooling from rain)
-                        temp_decrease = storm['intensity'] * 0.1 * falloff
-                        self.world.temperature[ny, nx] = max(0.0,
-                            self.world.temperature[ny, nx] - temp_decrease)
+        storms = self._storms
+        if len(storms['x']):
+            ny, nx, weight = self._expand_disks(storms['x'], storms['y'], storms['radius'], storms['intensity'])
+            
+            # Overlapping storms (and disks wrapping onto themselves) accumulate. Each effect
+            # has a single sign, so one clamp at the end matches clamping after every storm.
             
-            storm['duration'] -= 1
-            if storm['duration'] <= 0:
-                print(f"  🌤️ {storm['type'].capitalize()} dissipating")
+            # Moisture boost (rainfall)
+            np.add.at(self.world.moisture, (ny, nx), weight * 0.3)
+            np.minimum(self.world.moisture, 1.0, out=self.world.moisture)
+            
+            # Slight temperature drop (cooling from rain)
+            np.add.at(self.world.temperature, (ny, nx), weight * -0.1)
+            np.maximum(self.world.temperature, 0.0, out=self.world.temperature)
+        
+        storms['duration'] -= 1
+        if self.verbose:
+            for storm_type in storms['type'][storms['duration'] <= 0].tolist():
+                print(f"  🌤️ {storm_type.capitalize()} dissipating")
     
     def _process_droughts(self):
         """Apply drought effects to affected areas"""
-        for drought in self.droughts:
+        droughts = self._droughts
+        if len(droughts['x']):
+            ny, nx, weight = self._expand_disks(droughts['x'], droughts['y'], droughts['radius'], droughts['severity'])
+            
+            # Only affect land
+            land = self.world.elevation[ny, nx] > 0.4
+            ny, nx, weight = ny[land], nx[land], weight[land]
+            
             # Decrease moisture in drought area
-            for dy in range(-drought['radius'], drought['radius'] + 1):
-                for dx in range(-drought['radius'], drought['radius'] + 1):
-                    dist = np.sqrt(dx*dx + dy*dy)
-                    if dist <= drought['radius']:
-                        ny = (drought['y'] + dy) % self.height
-                        nx = (drought['x'] + dx) % self.width
-                        
-                        # Only affect land
-                        if self.world.elevation[ny, nx] > 0.4:
-                            falloff = 1.0 - (dist / drought['radius'])
-                            moisture_decrease = drought['severity'] * 0.15 * falloff
-                            self.world.moisture[ny, nx] = max(0.0,
-                                self.world.moisture[ny, nx] - moisture_decrease)
-                            
-                            # Temperature increase (heat from sun)
-                            temp_increase = drought['severity'] * 0.08 * falloff
-                            self.world.temperature[ny, nx] = min(1.0,
-                                self.world.temperature[ny, nx] + temp_increase)
+            np.add.at(self.world.moisture, (ny, nx), weight * -0.15)
+            np.maximum(self.world.moisture, 0.0, out=self.world.moisture)
             
-            drought['duration'] -= 1
-            if drought['duration'] <= 0:
+            # Temperature increase (heat from sun)
+            np.add.at(self.world.temperature, (ny, nx), weight * 0.08)
+            np.minimum(self.world.temperature, 1.0, out=self.world.temperature)
+        
+        droughts['duration'] -= 1
+        if self.verbose:
+            for _ in range(np.count_nonzero(droughts['duration'] <= 0)):
                 print(f"  🌧️ Drought ending")
     
     def visualize_climate(self):
-        """Display current climate state with weather overlays"""
-        fig, axes = plt.subplots(1, 2, figsize=(15, 7))
+        """Display current climate state with weather overlays, reusing one figure across calls"""
+        if self.headless:
+            return
         
-        # Temperature map with storms
-        temp_display = self.world.temperature.copy()
-        axes[0].imshow(temp_display, cmap='RdYlBu_r')
-        axes[0].set_title(f'Temperature - {self._season_name()} (Year {self.year})')
+        if self._figure is None or not plt.fignum_exists(self._figure.number):
+            self._build_climate_figure()
         
-        # Mark storms
-        for storm in self.storms:
-            circle = plt.Circle((storm['x'], storm['y']), storm['radius'], 
-                               color='purple', fill=False, linewidth=2, alpha=0.7)
-            axes[0].add_patch(circle)
-            axes[0].plot(storm['x'], storm['y'], 'w*', markersize=15)
+        title_suffix = f'{self._season_name()} (Year {self.year})'
         
-        axes[0].axis('off')
+        # Temperature map with storms
+        self._temp_image.set_data(self.world.temperature)
+        self._temp_image.autoscale()
+        self._temp_image.axes.set_title(f'Temperature - {title_suffix}')
+        storms = self._storms
+        self._storm_circles.set_paths([plt.Circle((x, y), r) for x, y, r in
+                                       zip(storms['x'].tolist(), storms['y'].tolist(), storms['radius'].tolist())])
+        self._storm_markers.set_data(storms['x'], storms['y'])
         
         # Moisture map with droughts
-        moist_display = self.world.moisture.copy()
-        axes[1].imshow(moist_display, cmap='Blues')
-        axes[1].set_title(f'Moisture - {self._season_name()} (Year {self.year})')
+        self._moist_image.set_data(self.world.moisture)
+        self._moist_image.autoscale()
+        self._moist_image.axes.set_title(f'Moisture - {title_suffix}')
+        droughts = self._droughts
+        self._drought_circles.set_paths([plt.Circle((x, y), r) for x, y, r in
+                                         zip(droughts['x'].tolist(), droughts['y'].tolist(), droughts['radius'].tolist())])
+        self._drought_markers.set_data(droughts['x'], droughts['y'])
         
-        # Mark droughts
-        for drought in self.droughts:
-            circle = plt.Circle((drought['x'], drought['y']), drought['radius'],
-                               color='red', fill=False, linewidth=2, alpha=0.7)
-            axes[1].add_patch(circle)
-            axes[1].plot(drought['x'], drought['y'], 'r+', markersize=15, markeredgewidth=3)
+        self._figure.canvas.draw_idle()
+        plt.pause(0.001)
+    
+    def _build_climate_figure(self):
+        """Create the climate figure and the artists that visualize_climate updates in place"""
+        fig, axes = plt.subplots(1, 2, figsize=(15, 7))
+        
+        self._temp_image = axes[0].imshow(self.world.temperature, cmap='RdYlBu_r')
+        self._storm_circles = PatchCollection([], facecolor='none', edgecolor='purple',
+                                              linewidth=2, alpha=0.7)
+        axes[0].add_collection(self._storm_circles, autolim=False)
+        self._storm_markers, = axes[0].plot([], [], 'w*', markersize=15)
+        axes[0].axis('off')
         
+        self._moist_image = axes[1].imshow(self.world.moisture, cmap='Blues')
+        self._drought_circles = PatchCollection([], facecolor='none', edgecolor='red',
+                                                linewidth=2, alpha=0.7)
+        axes[1].add_collection(self._drought_circles, autolim=False)
+        self._drought_markers, = axes[1].plot([], [], 'r+', markersize=15, markeredgewidth=3)
         axes[1].axis('off')
         
         plt.tight_layout()
-        plt.show()
+        plt.show(block=False)
+        self._figure = fig
 
 # Run simulation
 if __name__ == "__main__":
     # Generate world
     world = WorldGenerator(width=150, height=100, seed=42)
-    world.generate_world(sea_level=0.42)
+    world.generate_world(sea_level=0.42, cache_dir=".world_cache")
     
     # Initialize climate engine
     climate = ClimateEngine(world)
     
+    # Climate the biome map was last derived from
+    biome_temperature = world.temperature.copy()
+    biome_moisture = world.moisture.copy()
+    
     # Run for several years
     for turn in range(12):  # 3 years (4 seasons each)
         climate.advance_turn()
-        climate.visualize_climate()
+        if turn % 4 == 0:  # Once a year
+            climate.visualize_climate()
         
-        # Update biomes based on new climate
-        world.generate_biomes(sea_level=0.42)
+        # Update biomes based on new climate, only once it has drifted noticeably
+        if (np.max(np.abs(world.temperature - biome_temperature)) > 0.05 or
+                np.max(np.abs(world.moisture - biome_moisture)) > 0.05):
+            world.generate_biomes(sea_level=0.42)
+            biome_temperature[:] = world.temperature
+            biome_moisture[:] = world.moisture
+    
+    # Keep the final frame on screen
+    plt.show()
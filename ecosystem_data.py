@@ -4,6 +4,8 @@ For use in tribe survival game - defines predator-prey relationships,
 biomass ratios, and resource values based on trophic position.
 """
 
+import numpy as np
+
 # TROPHIC LEVEL DEFINITIONS
 TROPHIC_LEVELS = {
     'producer': 0,      # Plants (not in game)
@@ -13,9 +15,40 @@ TROPHIC_LEVELS = {
     'scavenger': 4,     # Decomposers
 }
 
+class AnimalSpecies:
+    """One ANIMALS entry. Fields are slots; dict-style access is kept for old callers."""
+    __slots__ = ('trophic_level', 'biomes', 'diet', 'spawn_weight', 'meat_yield', 'danger',
+                 'herd_size', 'speed', 'special_drops', 'hunting_style', 'behavior', 'biome_mask',
+                 'trophic_id')
+    
+    def __init__(self, **fields):
+        unknown = fields.keys() - set(self.__slots__)
+        if unknown:
+            raise TypeError(f"Unknown animal fields: {sorted(unknown)}")
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+    
+    def __repr__(self):
+        return f"AnimalSpecies({self.trophic_level}, spawn_weight={self.spawn_weight})"
+
+def _freeze_shared(table):
+    """Freeze a table's list values to tuples, with equal lists sharing one tuple."""
+    shared = {}
+    return {key: shared.setdefault(tuple(values), tuple(values)) for key, values in table.items()}
+
 # ANIMAL DATABASE
 # Each animal has: trophic_level, biome(s), diet, spawn_weight, meat_yield, danger
-ANIMALS = {
+_ANIMAL_RECORDS = {
     # HERBIVORES (Trophic Level 1)
     'rabbit': {
         'trophic_level': 'herbivore',
@@ -394,6 +427,18 @@ ANIMALS = {
     },
 }
 
+ANIMALS = {name: AnimalSpecies(**record) for name, record in _ANIMAL_RECORDS.items()}
+
+# Biome and diet lists are only ever membership-tested, so store them as frozensets;
+# drop lists are never mutated, so they become tuples (all empty ones share ())
+for _animal in ANIMALS.values():
+    _animal.biomes = frozenset(_animal.biomes)
+    if isinstance(_animal.diet, list):
+        _animal.diet = frozenset(_animal.diet)
+    _animal.special_drops = tuple(_animal.special_drops)
+    _animal.trophic_id = TROPHIC_LEVELS[_animal.trophic_level]
+del _animal
+
 # PREDATOR-PREY MATRIX
 # Key: Predator, Value: List of preferred prey
 PREDATION_MATRIX = {
@@ -416,6 +461,7 @@ PREDATION_MATRIX = {
     'shark': ['fish', 'marine_mammal'],
     'scavenger': [],  # Only eats carrion
 }
+PREDATION_MATRIX = _freeze_shared(PREDATION_MATRIX)
 
 # BIOME CARRYING CAPACITY (Max population density)
 CARRYING_CAPACITY = {
@@ -448,6 +494,7 @@ COMPETITION_GROUPS = {
     'aquatic_predators': ['crocodile', 'predatory_fish', 'shark'],
     'aerial_hunters': ['raptor'],
 }
+COMPETITION_GROUPS = _freeze_shared(COMPETITION_GROUPS)
 
 # BIOMASS RATIOS (for population spawn balancing)
 # Based on ecological pyramid: 10:1 ratio per trophic level
@@ -458,26 +505,81 @@ BIOMASS_RATIOS = {
     'scavenger': 5,     # Tied to predator activity
 }
 
+# BIOMASS_RATIOS as a fraction, indexed by trophic id (TROPHIC_LEVELS values)
+_RATIO_BY_ID = np.array([BIOMASS_RATIOS.get(level, 1.0) for level in TROPHIC_LEVELS]) / 100.0
+
+# BIOME IDS (bit positions in each animal's biome_mask, CARRYING_CAPACITY order)
+BIOME_ID = {biome: i for i, biome in enumerate(CARRYING_CAPACITY)}
+_ALL_BIOMES = 0xFFFFFFFF  # Mask for animals found in 'all' biomes
+
+# Integer animal ids (ANIMALS order; row index of the columnar views)
+ANIMAL_ID = {name: i for i, name in enumerate(ANIMALS)}
+
+_NAMES = np.array(list(ANIMALS))
+_CAPACITY = np.array(list(CARRYING_CAPACITY.values()), dtype=np.float32)  # Indexed by BIOME_ID
+
+# The remaining derived tables (per-animal columns, biome and prey bitmasks,
+# reverse indices, spawn rates) are filled by _build_indices() at the bottom.
+
+def get_animals_in_biome(biome):
+    """Returns list of animals that live in a given biome."""
+    biome_id = BIOME_ID.get(biome)
+    if biome_id is None:  # Unknown biome: only animals found everywhere
+        lives_here = _BIOME_MASK == _ALL_BIOMES
+    else:
+        lives_here = ((_BIOME_MASK >> biome_id) & 1).astype(bool)
+    return _NAMES[lives_here].tolist()
+
+def get_animals_by_trophic_level(trophic_level):
+    """Returns list of animals at a given trophic level (e.g. 'herbivore')."""
+    return _NAMES[_TROPHIC_ID == TROPHIC_LEVELS[trophic_level]].tolist()
+
 def calculate_spawn_rate(animal_name, biome):
     """
     Calculate spawn probability for an animal in a given biome.
     
     Returns float between 0-1 representing spawn chance.
     """
+    rate = _SPAWN_RATE.get((animal_name, biome))
+    if rate is None:  # Biome outside CARRYING_CAPACITY (or unknown animal)
+        rate = _compute_spawn_rate(animal_name, biome)
+    return rate
+
+def calculate_spawn_rates(biome_ids):
+    """
+    Calculate spawn probabilities for every animal over many biomes at once.
+    
+    biome_ids is an array of BIOME_ID values (e.g. a whole tile map, flattened).
+    Returns an (animals, tiles) float32 array; rows follow ANIMALS order.
+    """
+    biome_ids = np.asarray(biome_ids, dtype=np.intp)
+    spawn_rate = _SPAWN_WEIGHT.astype(np.float32)[:, None] * _CAPACITY[biome_ids]
+    spawn_rate *= _TROPHIC_RATIO[:, None]
+    spawn_rate /= 10000.0
+    lives_here = (_BIOME_MASK[:, None] >> biome_ids) & 1
+    spawn_rate[lives_here == 0] = 0.0
+    return np.minimum(spawn_rate, 1.0, out=spawn_rate)
+
+def _compute_spawn_rate(animal_name, biome):
+    """Spawn rate formula behind calculate_spawn_rate."""
     animal = ANIMALS[animal_name]
     
     # Check if animal lives in this biome
-    if biome not in animal['biomes'] and 'all' not in animal['biomes']:
+    biome_id = BIOME_ID.get(biome)
+    if biome_id is None:
+        if animal.biome_mask != _ALL_BIOMES:
+            return 0.0
+    elif not (animal.biome_mask >> biome_id) & 1:
         return 0.0
     
     # Base spawn from animal definition
-    base_spawn = animal['spawn_weight']
+    base_spawn = animal.spawn_weight
     
     # Modify by biome carrying capacity
     capacity_modifier = CARRYING_CAPACITY.get(biome, 1.0)
     
     # Modify by trophic level (maintain pyramid)
-    trophic_modifier = BIOMASS_RATIOS.get(animal['trophic_level'], 1.0) / 100.0
+    trophic_modifier = _RATIO_BY_ID.item(animal.trophic_id)
     
     # Final spawn rate (normalize to 0-1)
     spawn_rate = (base_spawn * capacity_modifier * trophic_modifier) / 10000.0
@@ -485,21 +587,74 @@ def calculate_spawn_rate(animal_name, biome):
     return min(spawn_rate, 1.0)
 
 def get_prey_for_predator(predator_name):
-    """Returns list of valid prey for a given predator."""
-    return PREDATION_MATRIX.get(predator_name, [])
+    """Returns the valid prey for a given predator (as a tuple)."""
+    return PREDATION_MATRIX.get(predator_name, ())
 
 def get_predators_for_prey(prey_name):
-    """Returns list of predators that hunt a given prey."""
-    predators = []
-    for predator, prey_list in PREDATION_MATRIX.items():
-        if prey_name in prey_list:
-            predators.append(predator)
-    return predators
+    """Returns the predators that hunt a given prey (as a tuple)."""
+    return _PREY_TO_PREDATORS.get(prey_name, ())
+
+def hunts(predator_name, prey_name):
+    """Returns True if the predator hunts the given prey."""
+    predator_id = ANIMAL_ID.get(predator_name)
+    prey_id = ANIMAL_ID.get(prey_name)
+    if predator_id is None or prey_id is None:
+        return False
+    return bool((int(_PREY_MASK[predator_id]) >> prey_id) & 1)
+
+def hunts_batch(predator_ids, prey_ids):
+    """Vectorized hunts() over arrays of ANIMAL_ID values; returns a bool array."""
+    prey_ids = np.asarray(prey_ids, dtype=np.uint64)
+    return ((_PREY_MASK[predator_ids] >> prey_ids) & np.uint64(1)).astype(bool)
 
 def get_competitors(animal_name):
-    """Returns list of animals that compete for same resources."""
-    competitors = []
-    for group, members in COMPETITION_GROUPS.items():
-        if animal_name in members:
-            competitors.extend([m for m in members if m != animal_name])
-    return list(set(competitors))  # Remove duplicates
+    """Returns the animals that compete for same resources (as a frozenset)."""
+    return _COMPETITORS.get(animal_name, frozenset())
+
+def _build_indices():
+    """
+    Derive every lookup table in a single walk over each source table:
+    ANIMALS (biome masks, columns, spawn rates), PREDATION_MATRIX (prey masks,
+    prey -> predators) and COMPETITION_GROUPS (competitor sets).
+    """
+    n = len(ANIMALS)
+    spawn_weight = np.empty(n, dtype=np.int32)
+    meat_yield = np.empty(n, dtype=np.int16)
+    danger = np.empty(n, dtype=np.int8)
+    trophic_id = np.empty(n, dtype=np.int8)
+    trophic_ratio = np.empty(n, dtype=np.float32)
+    biome_mask = np.empty(n, dtype=np.uint32)
+    spawn_rates = {}
+    
+    for i, (name, animal) in enumerate(ANIMALS.items()):
+        animal.biome_mask = (_ALL_BIOMES if 'all' in animal.biomes else
+                             sum(1 << BIOME_ID[biome] for biome in animal.biomes))
+        spawn_weight[i] = animal.spawn_weight
+        meat_yield[i] = animal.meat_yield
+        danger[i] = animal.danger
+        trophic_id[i] = animal.trophic_id
+        trophic_ratio[i] = _RATIO_BY_ID[animal.trophic_id]
+        biome_mask[i] = animal.biome_mask
+        for biome in CARRYING_CAPACITY:
+            spawn_rates[(name, biome)] = _compute_spawn_rate(name, biome)
+    
+    prey_mask = [0] * n
+    prey_to_predators = {}
+    for predator, prey_list in PREDATION_MATRIX.items():
+        for prey in dict.fromkeys(prey_list):
+            prey_mask[ANIMAL_ID[predator]] |= 1 << ANIMAL_ID[prey]
+            prey_to_predators.setdefault(prey, []).append(predator)
+    
+    competitors = {}
+    for members in COMPETITION_GROUPS.values():
+        for member in members:
+            competitors.setdefault(member, set()).update(m for m in members if m != member)
+    
+    return (spawn_weight, meat_yield, danger, trophic_id, trophic_ratio, biome_mask,
+            np.array(prey_mask, dtype=np.uint64),
+            {prey: tuple(predators) for prey, predators in prey_to_predators.items()},
+            {animal: frozenset(rivals) for animal, rivals in competitors.items()},
+            spawn_rates)
+
+(_SPAWN_WEIGHT, _MEAT_YIELD, _DANGER, _TROPHIC_ID, _TROPHIC_RATIO, _BIOME_MASK,
+ _PREY_MASK, _PREY_TO_PREDATORS, _COMPETITORS, _SPAWN_RATE) = _build_indices()
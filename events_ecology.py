@@ -1,8 +1,12 @@
+import itertools
 import numpy as np
 import matplotlib.pyplot as plt
+from animal_system import SpatialGrid
 
 class Scavenger:
     """Opportunistic feeders that consume carrion"""
+    __slots__ = ('x', 'y', 'species', 'energy', 'age', 'reproductive_cooldown', 'cause_of_death')
+    
     def __init__(self, x, y, species_name):
         self.x = x
         self.y = y
@@ -28,6 +32,9 @@ class Scavenger:
 
 class AvianCreature:
     """Flying species - birds, raptors"""
+    __slots__ = ('x', 'y', 'species', 'energy', 'age', 'reproductive_cooldown', 'migration_target',
+                 'cause_of_death')
+    
     def __init__(self, x, y, species_name):
         self.x = x
         self.y = y
@@ -54,6 +61,8 @@ class AvianCreature:
 
 class AquaticCreature:
     """Water-dwelling species"""
+    __slots__ = ('x', 'y', 'species', 'energy', 'age', 'reproductive_cooldown', 'cause_of_death')
+    
     def __init__(self, x, y, species_name):
         self.x = x
         self.y = y
@@ -77,8 +86,145 @@ class AquaticCreature:
         return self.energy > 0
 
 
+# Species names per population; a creature's species code indexes these
+SCAVENGER_SPECIES = ('scavenger',)
+AVIAN_SPECIES = ('songbird', 'waterfowl', 'raptor', 'seabird', 'insectivore')
+AQUATIC_SPECIES = ('fish', 'predatory_fish', 'marine_mammal', 'shark')
+
+SONGBIRD, WATERFOWL, RAPTOR, SEABIRD, INSECTIVORE = range(len(AVIAN_SPECIES))
+FISH, PREDATORY_FISH, MARINE_MAMMAL, SHARK = range(len(AQUATIC_SPECIES))
+
+# Aquatic hunters: species -> (prey species, success chance, energy per kill)
+AQUATIC_HUNTS = {
+    PREDATORY_FISH: ((FISH,), 0.2, 0.3),  # Hunt smaller fish
+    MARINE_MAMMAL: ((FISH, PREDATORY_FISH), 0.15, 0.25),  # Larger, hunt fish
+    SHARK: ((FISH, PREDATORY_FISH, MARINE_MAMMAL), 0.25, 0.4),  # Apex predator
+}
+
+
+def _hunt_tables():
+    """AQUATIC_HUNTS as arrays by hunter code: prey mask [hunter, prey], success chance, energy per kill"""
+    n = len(AQUATIC_SPECIES)
+    prey_mask = np.zeros((n, n), dtype=bool)
+    success = np.zeros(n)
+    reward = np.zeros(n)
+    for hunter, (prey, chance, energy) in AQUATIC_HUNTS.items():
+        prey_mask[hunter, list(prey)] = True
+        success[hunter] = chance
+        reward[hunter] = energy
+    return prey_mask, success, reward
+
+
+_HUNT_PREY, _HUNT_SUCCESS, _HUNT_REWARD = _hunt_tables()
+
+
+def _cell_index(xs, ys, width, height):
+    """Counting-sort cell index: the members of flat cell c are order[start[c]:start[c + 1]]"""
+    cell_ids = ys.astype(np.intp) * width + xs
+    order = np.argsort(cell_ids, kind='stable')
+    start = np.zeros(width * height + 1, dtype=np.intp)
+    np.cumsum(np.bincount(cell_ids, minlength=width * height), out=start[1:])
+    return order, start
+
+
+def _cell_members(order, start, cells):
+    """Members of each of the given cells (see _cell_index), cell by cell: (member, position in cells)"""
+    begin = start[cells]
+    counts = start[cells + 1] - begin
+    k = np.repeat(np.arange(len(cells)), counts)
+    # Each cell's members are a contiguous run of the sorted order
+    offset = np.arange(len(k)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return order[begin[k] + offset], k
+
+
+class CreaturePool:
+    """Per-turn structure-of-arrays view of one creature population
+
+    gather() copies the creatures' scalars into parallel arrays at the start of
+    a turn; the update runs on the arrays (newborns are appended as rows with
+    add()) and compact() drops the dead and writes the survivors back.
+    """
+    def __init__(self, creature_class, species_names):
+        self.creature_class = creature_class
+        self.species_names = species_names
+        self.species_index = {name: i for i, name in enumerate(species_names)}
+        self.gather([])
+
+    def __len__(self):
+        return len(self.xs)
+
+    def gather(self, creatures):
+        """Copy per-creature scalars from the creature objects into parallel arrays"""
+        n = len(creatures)
+        self.xs = np.fromiter((c.x for c in creatures), dtype=np.int16, count=n)
+        self.ys = np.fromiter((c.y for c in creatures), dtype=np.int16, count=n)
+        self.energy = np.fromiter((c.energy for c in creatures), dtype=np.float64, count=n)
+        self.age = np.fromiter((c.age for c in creatures), dtype=np.int32, count=n)
+        self.cooldown = np.fromiter((c.reproductive_cooldown for c in creatures), dtype=np.int8, count=n)
+        self.species = np.fromiter((self.species_index[c.species] for c in creatures), dtype=np.uint8, count=n)
+        self.preyed_on = np.zeros(n, dtype=bool)
+
+    def add(self, parents, energy):
+        """Append one newborn per entry of parents (indices), at the parent's cell"""
+        self.xs = np.concatenate([self.xs, self.xs[parents]])
+        self.ys = np.concatenate([self.ys, self.ys[parents]])
+        self.energy = np.concatenate([self.energy, np.full(len(parents), energy)])
+        self.age = np.concatenate([self.age, np.zeros(len(parents), dtype=self.age.dtype)])
+        self.cooldown = np.concatenate([self.cooldown, np.zeros(len(parents), dtype=self.cooldown.dtype)])
+        self.species = np.concatenate([self.species, self.species[parents]])
+        self.preyed_on = np.concatenate([self.preyed_on, np.zeros(len(parents), dtype=bool)])
+
+    def consume_energy(self, idx, amount):
+        self.energy[idx] = np.maximum(self.energy[idx] - amount, 0)
+
+    def grow_older(self, metabolism, old_age=None, aging_cost=0.1):
+        """Age everyone a turn and charge metabolism, plus aging_cost for those past old_age"""
+        self.age += 1
+        self.energy -= metabolism
+        if old_age is not None:
+            self.energy -= np.where(self.age > old_age, aging_cost, 0.0)
+        np.maximum(self.energy, 0, out=self.energy)
+
+    def gain_energy(self, idx, amount):
+        self.energy[idx] = np.minimum(self.energy[idx] + amount, 1.0)
+
+    def death_causes(self, dead, old_age=None):
+        """Cause of death per dead row: predation, else starvation (or old age past old_age)"""
+        causes = np.where(self.preyed_on[dead], 'predation', 'starvation')
+        if old_age is not None:
+            causes[~self.preyed_on[dead] & (self.age[dead] > old_age)] = 'old_age'
+        return causes.tolist()
+
+    def compact(self, creatures, alive=None):
+        """Drop the dead rows and return the surviving creature objects, updated
+
+        Rows past len(creatures) are newborns; their objects are created here.
+        alive is the energy > 0 mask, if the caller already has it.
+        """
+        live = np.flatnonzero(self.energy > 0 if alive is None else alive)
+        for name in ('xs', 'ys', 'energy', 'age', 'cooldown', 'species', 'preyed_on'):
+            setattr(self, name, getattr(self, name)[live])
+
+        survivors = []
+        for i, x, y, energy, age, cooldown, species in zip(
+                live.tolist(), self.xs.tolist(), self.ys.tolist(), self.energy.tolist(),
+                self.age.tolist(), self.cooldown.tolist(), self.species.tolist()):
+            if i < len(creatures):
+                creature = creatures[i]
+                creature.x, creature.y = x, y
+            else:
+                creature = self.creature_class(x, y, self.species_names[species])
+            creature.energy = energy
+            creature.age = age
+            creature.reproductive_cooldown = cooldown
+            survivors.append(creature)
+        return survivors
+
+
 class Disease:
     """Disease outbreak affecting animal populations"""
+    __slots__ = ('x', 'y', 'type', 'virulence', 'spread_rate', 'duration', 'radius', 'infected_animals')
+    
     def __init__(self, x, y, disease_type, virulence, duration):
         self.x = x
         self.y = y
@@ -87,18 +233,20 @@ class Disease:
         self.spread_rate = virulence * 0.5  # How fast it spreads
         self.duration = duration
         self.radius = 5
-        self.infected_animals = set()  # Track which animals are infected
+        self.infected_animals = set()  # Track which animals are infected (by animal.id)
 
 
 class NaturalDisaster:
     """Catastrophic events affecting the ecosystem"""
-    def __init__(self, x, y, disaster_type, intensity, duration):
+    __slots__ = ('x', 'y', 'type', 'intensity', 'duration', 'radius')
+    
+    def __init__(self, x, y, disaster_type, intensity, duration, radius=None):
         self.x = x
         self.y = y
         self.type = disaster_type  # 'wildfire', 'flood', 'earthquake', 'blizzard'
         self.intensity = intensity
         self.duration = duration
-        self.radius = np.random.randint(8, 20)
+        self.radius = np.random.randint(8, 20) if radius is None else radius
 
 
 class InsectSystem:
@@ -111,28 +259,41 @@ class InsectSystem:
         self.density = np.random.uniform(0.1, 0.3, (height, width))
         # 10 Billion per tile * 15,000 tiles = 150 Trillion global capacity
         self.max_density_per_tile = 10_000_000_000 
+        # Scratch arrays for the growth term, allocated on the first update (see _buffers)
+        self._temp_buf = self._moist_buf = self._growth_buf = None
     
     def update(self, climate_engine, vegetation_system):
         # Insects thrive in warm, moist, vegetated areas
-        # Growth
-        temp_factor = np.clip(self.world.temperature, 0, 1)
-        moist_factor = np.clip(self.world.moisture, 0, 1)
-        veg_factor = vegetation_system.density
-        
         # Seasonality
         season_mod = 1.0
         if climate_engine.season == 3: # Winter
             season_mod = 0.1
         elif climate_engine.season == 1: # Summer
             season_mod = 1.5
-            
-        growth = 0.3 * temp_factor * moist_factor * veg_factor * season_mod
+        
+        # Growth: 0.3 * temperature * moisture * vegetation * season, built up
+        # in place (in the same order, so the rounding is unchanged)
+        temp, moist, growth = self._buffers(vegetation_system)
+        np.clip(self.world.temperature, 0, 1, out=temp)
+        temp *= 0.3
+        temp *= np.clip(self.world.moisture, 0, 1, out=moist)
+        np.multiply(temp, vegetation_system.density, out=growth)  # Widens to the vegetation dtype
+        growth *= season_mod
         
         self.density += growth
             
         # Natural decay / carrying capacity
         self.density *= 0.95
-        self.density = np.clip(self.density, 0, 1.0)
+        np.clip(self.density, 0, 1.0, out=self.density)
+    
+    def _buffers(self, vegetation_system):
+        """Per-turn scratch arrays, reused while the climate and vegetation dtypes stay the same"""
+        if self._temp_buf is None or self._temp_buf.dtype != self.world.temperature.dtype:
+            self._temp_buf = np.empty_like(self.world.temperature)
+            self._moist_buf = np.empty_like(self.world.moisture)
+            self._growth_buf = np.empty(self._temp_buf.shape,
+                                        np.result_type(self._temp_buf, vegetation_system.density))
+        return self._temp_buf, self._moist_buf, self._growth_buf
         
     def consume(self, x, y, amount):
         """
@@ -152,6 +313,37 @@ class InsectSystem:
         consumed_density = min(available, density_cost)
         self.density[y, x] -= consumed_density
         return consumed_density
+    
+    def consume_batch(self, xs, ys, amount):
+        """
+        Vectorized consume() for many consumers at once.
+        amount is one value for everyone, or an array with one value per consumer.
+        Consumers sharing a tile eat one after another in array order, each taking
+        what the ones before it left.
+        Returns: Density fraction consumed per consumer.
+        """
+        density_cost = np.where(np.asarray(amount) > 1.0, amount / self.max_density_per_tile, amount)
+        density_cost = np.broadcast_to(density_cost, np.shape(xs)).astype(np.float64)
+        if len(density_cost) == 0:
+            return density_cost
+        
+        # Group consumers by tile (stable, so array order holds within a tile)
+        cells = np.asarray(ys, dtype=np.intp) * self.width + xs
+        order = np.argsort(cells, kind='stable')
+        cells, cost = cells[order], density_cost[order]
+        
+        # Insects already eaten by the consumers ahead on the same tile
+        eaten_before = np.cumsum(cost) - cost
+        group_start = np.r_[True, cells[1:] != cells[:-1]]
+        eaten_before -= eaten_before[group_start][np.cumsum(group_start) - 1]
+        left = self.density.ravel()[cells] - eaten_before
+        
+        consumed_density = np.empty_like(cost)
+        consumed_density[order] = np.clip(left, 0, cost)
+        np.subtract.at(self.density, (ys, xs), consumed_density)
+        # The shares never exceed the tile, but their sum can round a hair below zero
+        np.maximum(self.density, 0, out=self.density)
+        return consumed_density
 
     def get_total_count(self):
         return int(np.sum(self.density) * self.max_density_per_tile)
@@ -165,6 +357,12 @@ class EventsEcologySystem:
         self.predators = predator_system
         self.width = world_generator.width
         self.height = world_generator.height
+        # Seeded from the global NumPy state so seeded worlds stay reproducible
+        self.rng = np.random.default_rng(np.random.randint(0, 2**31))
+        
+        # Wrapped coordinate tables: wrap_x[x + dx + width] == (x + dx) % width for |dx| <= width
+        self._wrap_x = np.tile(np.arange(self.width), 3)
+        self._wrap_y = np.tile(np.arange(self.height), 3)
         
         # Sub-systems
         self.insects = InsectSystem(self.width, self.height, self.world)
@@ -174,10 +372,20 @@ class EventsEcologySystem:
         self.avian_creatures = []
         self.aquatic_creatures = []
         
+        # Per-turn array views of the populations (see CreaturePool)
+        self.scavenger_pool = CreaturePool(Scavenger, SCAVENGER_SPECIES)
+        self.avian_pool = CreaturePool(AvianCreature, AVIAN_SPECIES)
+        self.aquatic_pool = CreaturePool(AquaticCreature, AQUATIC_SPECIES)
+        
         # Active events
         self.diseases = []
         self.disasters = []
-        self.carrion_locations = []  # (x, y, energy_value, age)
+        self._disk_cache = {}  # radius -> (dy, dx, falloff) disk offsets
+        # Carrion sites as parallel arrays: position, energy value, age
+        self.carrion_x = np.zeros(0, dtype=np.int32)
+        self.carrion_y = np.zeros(0, dtype=np.int32)
+        self.carrion_energy = np.zeros(0)
+        self.carrion_age = np.zeros(0, dtype=np.int32)
         
         # Statistics
         self.disease_deaths = 0
@@ -202,28 +410,26 @@ class EventsEcologySystem:
     
     def spawn_scavengers(self, count=30):
         """Spawn scavengers (vultures, hyenas, crows)"""
-        for _ in range(count):
-            x = np.random.randint(0, self.width)
-            y = np.random.randint(0, self.height)
-            
-            # Scavengers spawn near land
-            if self.world.elevation[y, x] > 0.4:
-                scavenger = Scavenger(x, y, 'scavenger')
-                scavenger.energy = 0.6
-                self.scavengers.append(scavenger)
+        xs = self.rng.integers(0, self.width, count)
+        ys = self.rng.integers(0, self.height, count)
+        
+        # Scavengers spawn near land
+        land = self.world.elevation[ys, xs] > 0.4
+        for x, y in zip(xs[land].tolist(), ys[land].tolist()):
+            scavenger = Scavenger(x, y, 'scavenger')
+            scavenger.energy = 0.6
+            self.scavengers.append(scavenger)
         
         print(f"  🦅 Spawned {len(self.scavengers)} scavengers")
     
     def spawn_avian_species(self, count=80):
         """Spawn birds - mix of herbivorous and carnivorous"""
-        species_types = ['songbird', 'waterfowl', 'raptor', 'seabird', 'insectivore']
+        xs = self.rng.integers(0, self.width, count).tolist()
+        ys = self.rng.integers(0, self.height, count).tolist()
+        species = self.rng.integers(0, len(AVIAN_SPECIES), count).tolist()
         
-        for _ in range(count):
-            x = np.random.randint(0, self.width)
-            y = np.random.randint(0, self.height)
-            species = np.random.choice(species_types)
-            
-            bird = AvianCreature(x, y, species)
+        for x, y, code in zip(xs, ys, species):
+            bird = AvianCreature(x, y, AVIAN_SPECIES[code])
             bird.energy = 0.7
             self.avian_creatures.append(bird)
         
@@ -231,29 +437,17 @@ class EventsEcologySystem:
     
     def spawn_aquatic_species(self, count=100):
         """Spawn fish and marine life"""
-        spawned = 0
-        for _ in range(count * 2):
-            x = np.random.randint(0, self.width)
-            y = np.random.randint(0, self.height)
-            
-            # Only spawn in water
-            if self.world.elevation[y, x] < 0.4:
-                rand = np.random.random()
-                if rand < 0.6:
-                    species = 'fish'
-                elif rand < 0.8:
-                    species = 'predatory_fish'
-                elif rand < 0.95:
-                    species = 'marine_mammal'
-                else:
-                    species = 'shark'
-                    
-                aquatic = AquaticCreature(x, y, species)
-                aquatic.energy = 0.8
-                self.aquatic_creatures.append(aquatic)
-                spawned += 1
-                if spawned >= count:
-                    break
+        # Up to count * 2 tries, keeping the first count that land in water
+        xs = self.rng.integers(0, self.width, count * 2)
+        ys = self.rng.integers(0, self.height, count * 2)
+        water = np.flatnonzero(self.world.elevation[ys, xs] < 0.4)[:count]
+        
+        # 60% fish, 20% predatory fish, 15% marine mammals, 5% sharks
+        species = np.searchsorted([0.6, 0.8, 0.95], self.rng.random(len(water)), side='right')
+        for x, y, code in zip(xs[water].tolist(), ys[water].tolist(), species.tolist()):
+            aquatic = AquaticCreature(x, y, AQUATIC_SPECIES[code])
+            aquatic.energy = 0.8
+            self.aquatic_creatures.append(aquatic)
         
         print(f"  🐟 Spawned {len(self.aquatic_creatures)} aquatic creatures")
     
@@ -262,17 +456,28 @@ class EventsEcologySystem:
         # Update insects
         self.insects.update(climate_engine, self.vegetation)
 
+        # Load the populations into their arrays for this turn
+        self.scavenger_pool.gather(self.scavengers)
+        self.avian_pool.gather(self.avian_creatures)
+        self.aquatic_pool.gather(self.aquatic_creatures)
+
         # Track carrion (dead animals become food for scavengers)
         self._track_carrion()
         
         # Handle migration (re-population)
         self._handle_migration(climate_engine)
         
+        # Bucket herbivores and predators by cell for outbreaks and disasters
+        herbivore_grid = predator_grid = None
+        if self.diseases or self.disasters:
+            herbivore_grid = self._spatial_grid(self.herbivores.herbivores)
+            predator_grid = self._spatial_grid(self.predators.predators)
+        
         # Update diseases
-        self._update_diseases()
+        self._update_diseases(herbivore_grid, predator_grid)
         
         # Update disasters
-        self._update_disasters(climate_engine)
+        self._update_disasters(climate_engine, herbivore_grid, predator_grid)
         
         # Generate new events
         self._generate_events(climate_engine)
@@ -286,81 +491,89 @@ class EventsEcologySystem:
         # Update aquatic species
         self._update_aquatic()
         
-        # Log deaths before cleanup
-        if self.logger_callback:
-            for s in self.scavengers:
-                if not s.is_alive():
-                    cause = s.cause_of_death if s.cause_of_death else 'starvation'
-                    self.logger_callback('death', s.species, details=cause)
-            
-            for a in self.avian_creatures:
-                if not a.is_alive():
-                    cause = a.cause_of_death if a.cause_of_death else 'starvation'
-                    if a.age > 100 and cause == 'starvation': cause = 'old_age'
-                    self.logger_callback('death', a.species, details=cause)
-            
-            for a in self.aquatic_creatures:
-                if not a.is_alive():
-                    cause = a.cause_of_death if a.cause_of_death else 'starvation'
-                    if a.age > 120 and cause == 'starvation': cause = 'old_age'
-                    self.logger_callback('death', a.species, details=cause)
-
-        # Clean up dead creatures
-        self.scavengers = [s for s in self.scavengers if s.is_alive()]
-        self.avian_creatures = [a for a in self.avian_creatures if a.is_alive()]
-        self.aquatic_creatures = [a for a in self.aquatic_creatures if a.is_alive()]
+        # Log deaths, drop the dead and write the survivors back
+        self.scavengers = self._remove_dead(self.scavenger_pool, self.scavengers)
+        self.avian_creatures = self._remove_dead(self.avian_pool, self.avian_creatures, old_age=100)
+        self.aquatic_creatures = self._remove_dead(self.aquatic_pool, self.aquatic_creatures, old_age=120)
         
         # Track populations
         self.scavenger_history.append(len(self.scavengers))
         self.avian_history.append(len(self.avian_creatures))
         self.aquatic_history.append(len(self.aquatic_creatures))
     
+    def _remove_dead(self, pool, creatures, old_age=None):
+        """Log this turn's deaths in a pool and return its surviving creatures"""
+        alive = pool.energy > 0
+        if self.logger_callback:
+            dead = np.flatnonzero(~alive)
+            for species, cause in zip(pool.species[dead].tolist(), pool.death_causes(dead, old_age)):
+                self.logger_callback('death', pool.species_names[species], details=cause)
+        return pool.compact(creatures, alive)
+    
     def _track_carrion(self):
         """Create carrion markers from dead animals"""
         # Age existing carrion
-        self.carrion_locations = [(x, y, energy * 0.8, age + 1) 
-                                  for x, y, energy, age in self.carrion_locations 
-                                  if age < 5 and energy > 0.05]  # Decays over time
+        keep = (self.carrion_age < 5) & (self.carrion_energy > 0.05)  # Decays over time
+        self.carrion_x, self.carrion_y = self.carrion_x[keep], self.carrion_y[keep]
+        self.carrion_energy = self.carrion_energy[keep] * 0.8
+        self.carrion_age = self.carrion_age[keep] + 1
         
         # Add new carrion from recent deaths
         # (In a real implementation, we'd track individual deaths, but we'll simulate)
         death_chance = 0.15  # Increased chance of finding carrion each turn (was 0.05)
-        for _ in range(int(death_chance * 100)):
-            x = np.random.randint(0, self.width)
-            y = np.random.randint(0, self.height)
-            if self.world.elevation[y, x] > 0.4:  # On land
-                self.carrion_locations.append((x, y, 0.5, 0))
+        tries = int(death_chance * 100)
+        xs = self.rng.integers(0, self.width, tries)
+        ys = self.rng.integers(0, self.height, tries)
+        land = self.world.elevation[ys, xs] > 0.4  # On land
+        count = np.count_nonzero(land)
+        self.carrion_x = np.concatenate((self.carrion_x, xs[land].astype(np.int32)))
+        self.carrion_y = np.concatenate((self.carrion_y, ys[land].astype(np.int32)))
+        self.carrion_energy = np.concatenate((self.carrion_energy, np.full(count, 0.5)))
+        self.carrion_age = np.concatenate((self.carrion_age, np.zeros(count, dtype=np.int32)))
+    
+    @staticmethod
+    def _coords(animals):
+        """(xs, ys) arrays of a list of animals or creatures"""
+        n = len(animals)
+        xs = np.fromiter((a.x for a in animals), dtype=np.intp, count=n)
+        ys = np.fromiter((a.y for a in animals), dtype=np.intp, count=n)
+        return xs, ys
+    
+    def _spatial_grid(self, animals):
+        """Cell lookup over a list of animals (see SpatialGrid)"""
+        xs, ys = self._coords(animals)
+        return SpatialGrid(animals, xs, ys, self.width, self.height)
     
-    def _update_diseases(self):
+    def _spread_disease(self, disease, grid, box):
+        """Infect (and damage) the animals of one grid within the outbreak's radius"""
+        idx = grid.box_indices(*box)
+        dist2 = (grid.xs[idx] - disease.x)**2 + (grid.ys[idx] - disease.y)**2
+        in_range = [grid.animals[i] for i in idx[dist2 < disease.radius**2].tolist()]
+        
+        # Each animal not yet infected catches it with chance spread_rate
+        exposed = [animal for animal in in_range if animal.id not in disease.infected_animals]
+        caught = self.rng.random(len(exposed)) < disease.spread_rate
+        for animal in itertools.compress(exposed, caught.tolist()):
+            disease.infected_animals.add(animal.id)
+            # Apply damage
+            animal.consume_energy(disease.virulence * 0.3)
+            if not animal.is_alive():
+                animal.cause_of_death = f"disease_{disease.type}"
+                self.disease_deaths += 1
+    
+    def _update_diseases(self, herbivore_grid, predator_grid):
         """Process active disease outbreaks"""
         for disease in self.diseases:
+            # Only animals inside the outbreak's bounding box can be in range
+            box = (disease.x - disease.radius, disease.y - disease.radius,
+                   disease.x + disease.radius + 1, disease.y + disease.radius + 1)
+            
             # Spread to nearby animals
             if disease.type in ['herbivore', 'all']:
-                for animal in self.herbivores.herbivores:
-                    dist = np.sqrt((animal.x - disease.x)**2 + (animal.y - disease.y)**2)
-                    if dist < disease.radius:
-                        animal_id = id(animal)
-                        if animal_id not in disease.infected_animals:
-                            if np.random.random() < disease.spread_rate:
-                                disease.infected_animals.add(animal_id)
-                                # Apply damage
-                                animal.consume_energy(disease.virulence * 0.3)
-                                if not animal.is_alive():
-                                    animal.cause_of_death = f"disease_{disease.type}"
-                                    self.disease_deaths += 1
+                self._spread_disease(disease, herbivore_grid, box)
             
             if disease.type in ['predator', 'all']:
-                for pred in self.predators.predators:
-                    dist = np.sqrt((pred.x - disease.x)**2 + (pred.y - disease.y)**2)
-                    if dist < disease.radius:
-                        pred_id = id(pred)
-                        if pred_id not in disease.infected_animals:
-                            if np.random.random() < disease.spread_rate:
-                                disease.infected_animals.add(pred_id)
-                                pred.consume_energy(disease.virulence * 0.3)
-                                if not pred.is_alive():
-                                    pred.cause_of_death = f"disease_{disease.type}"
-                                    self.disease_deaths += 1
+                self._spread_disease(disease, predator_grid, box)
             
             disease.duration -= 1
             disease.radius += 1  # Disease spreads outward
@@ -368,74 +581,66 @@ class EventsEcologySystem:
         # Remove expired diseases
         self.diseases = [d for d in self.diseases if d.duration > 0]
     
-    def _update_disasters(self, climate_engine):
+    def _disk(self, radius):
+        """Cached (dy, dx, falloff) offsets covering a disk of the given radius, row by row"""
+        if radius not in self._disk_cache:
+            dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+            dist2 = dx*dx + dy*dy
+            mask = dist2 <= radius * radius
+            falloff = 1 - np.sqrt(dist2[mask]) / radius
+            self._disk_cache[radius] = (dy[mask], dx[mask], falloff)
+        return self._disk_cache[radius]
+    
+    def _occupants(self, grid, ny, nx):
+        """Animals of the grid in the cells (ny, nx), in cell order: (animal index, position in (ny, nx))"""
+        return _cell_members(grid.order, grid.cell_start, ny * self.width + nx)
+    
+    def _update_disasters(self, climate_engine, herbivore_grid, predator_grid):
         """Process active natural disasters"""
         for disaster in self.disasters:
+            # Wrapped cells covered by the disaster, and its falloff from the centre
+            dy, dx, falloff = self._disk(disaster.radius)
+            ny = (disaster.y + dy) % self.height
+            nx = (disaster.x + dx) % self.width
+            
             if disaster.type == 'wildfire':
                 # Burns vegetation, kills animals
-                for dy in range(-disaster.radius, disaster.radius + 1):
-                    for dx in range(-disaster.radius, disaster.radius + 1):
-                        dist = np.sqrt(dx*dx + dy*dy)
-                        if dist <= disaster.radius:
-                            ny = (disaster.y + dy) % self.height
-                            nx = (disaster.x + dx) % self.width
-                            
-                            # Burn vegetation
-                            burn_amount = disaster.intensity * (1 - dist / disaster.radius)
-                            self.vegetation.density[ny, nx] *= (1 - burn_amount * 0.8)
-                            
-                            # Kill animals in fire
-                            for animal in self.herbivores.herbivores:
-                                if animal.x == nx and animal.y == ny:
-                                    if np.random.random() < burn_amount * 0.5:
-                                        animal.energy = 0
-                                        animal.cause_of_death = 'wildfire'
-                                        self.disaster_deaths += 1
-                            
-                            for pred in self.predators.predators:
-                                if pred.x == nx and pred.y == ny:
-                                    if np.random.random() < burn_amount * 0.4:
-                                        pred.energy = 0
-                                        pred.cause_of_death = 'wildfire'
-                                        self.disaster_deaths += 1
+                burn_amount = disaster.intensity * falloff
+                # .at applies a cell once per offset, even where a wrapped disk overlaps itself
+                np.multiply.at(self.vegetation.density, (ny, nx), 1 - burn_amount * 0.8)
+                
+                # Kill animals in fire (herbivores 50%, predators 40% of the local burn)
+                for grid, lethality in ((herbivore_grid, 0.5), (predator_grid, 0.4)):
+                    idx, k = self._occupants(grid, ny, nx)
+                    for i in idx[self.rng.random(len(idx)) < burn_amount[k] * lethality].tolist():
+                        animal = grid.animals[i]
+                        animal.energy = 0
+                        animal.cause_of_death = 'wildfire'
+                        self.disaster_deaths += 1
             
             elif disaster.type == 'flood':
                 # Drowns land animals, increases moisture
-                for dy in range(-disaster.radius, disaster.radius + 1):
-                    for dx in range(-disaster.radius, disaster.radius + 1):
-                        dist = np.sqrt(dx*dx + dy*dy)
-                        if dist <= disaster.radius:
-                            ny = (disaster.y + dy) % self.height
-                            nx = (disaster.x + dx) % self.width
-                            
-                            # Increase moisture
-                            self.world.moisture[ny, nx] = min(1.0, 
-                                self.world.moisture[ny, nx] + disaster.intensity * 0.3)
-                            
-                            # Kill animals
-                            for animal in self.herbivores.herbivores:
-                                if animal.x == nx and animal.y == ny:
-                                    if np.random.random() < disaster.intensity * 0.3:
-                                        animal.energy = 0
-                                        animal.cause_of_death = 'flood'
-                                        self.disaster_deaths += 1
+                np.add.at(self.world.moisture, (ny, nx), disaster.intensity * 0.3)  # Once per offset, as above
+                self.world.moisture[ny, nx] = np.minimum(1.0, self.world.moisture[ny, nx])
+                
+                # Kill animals
+                idx, _ = self._occupants(herbivore_grid, ny, nx)
+                for i in idx[self.rng.random(len(idx)) < disaster.intensity * 0.3].tolist():
+                    animal = herbivore_grid.animals[i]
+                    animal.energy = 0
+                    animal.cause_of_death = 'flood'
+                    self.disaster_deaths += 1
             
             elif disaster.type == 'blizzard':
                 # Freezes animals, covers vegetation
-                for dy in range(-disaster.radius, disaster.radius + 1):
-                    for dx in range(-disaster.radius, disaster.radius + 1):
-                        dist = np.sqrt(dx*dx + dy*dy)
-                        if dist <= disaster.radius:
-                            ny = (disaster.y + dy) % self.height
-                            nx = (disaster.x + dx) % self.width
-                            
-                            # Cold damage to animals
-                            for animal in self.herbivores.herbivores:
-                                if animal.x == nx and animal.y == ny:
-                                    animal.consume_energy(disaster.intensity * 0.2)
-                                    if not animal.is_alive():
-                                        animal.cause_of_death = 'blizzard'
-                                        self.disaster_deaths += 1
+                # Cold damage to animals
+                idx, _ = self._occupants(herbivore_grid, ny, nx)
+                for i in idx.tolist():
+                    animal = herbivore_grid.animals[i]
+                    animal.consume_energy(disaster.intensity * 0.2)
+                    if not animal.is_alive():
+                        animal.cause_of_death = 'blizzard'
+                        self.disaster_deaths += 1
             
             disaster.duration -= 1
         
@@ -444,14 +649,23 @@ class EventsEcologySystem:
     
     def _generate_events(self, climate_engine):
         """Randomly spawn diseases and disasters"""
-        # Disease outbreak chance
-        if np.random.random() < 0.02:  # 2% chance per turn
-            x = np.random.randint(0, self.width)
-            y = np.random.randint(0, self.height)
+        # Natural disaster chance (higher in certain seasons/conditions)
+        disaster_chance = 0.01
+        
+        # Wildfires more likely in summer, dry areas
+        if climate_engine.season == 1:  # Summer
+            disaster_chance += 0.02
+        
+        # One roll per kind of event; an event that fires draws all its parameters in one batch
+        outbreak, disaster_strikes = self.rng.random(2) < (0.02, disaster_chance)  # Disease: 2% chance per turn
+        
+        if outbreak:
+            u = self.rng.random(5)
+            x, y = int(u[0] * self.width), int(u[1] * self.height)
             
-            disease_type = np.random.choice(['herbivore', 'predator', 'all'])
-            virulence = np.random.uniform(0.3, 0.8)
-            duration = np.random.randint(5, 15)
+            disease_type = ('herbivore', 'predator', 'all')[int(u[2] * 3)]
+            virulence = 0.3 + 0.5 * u[3]
+            duration = 5 + int(u[4] * 10)
             
             disease = Disease(x, y, disease_type, virulence, duration)
             self.diseases.append(disease)
@@ -459,16 +673,9 @@ class EventsEcologySystem:
             print(f"  🦠 {event_msg}")
             self.recent_events.append(event_msg)
         
-        # Natural disaster chance (higher in certain seasons/conditions)
-        disaster_chance = 0.01
-        
-        # Wildfires more likely in summer, dry areas
-        if climate_engine.season == 1:  # Summer
-            disaster_chance += 0.02
-        
-        if np.random.random() < disaster_chance:
-            x = np.random.randint(0, self.width)
-            y = np.random.randint(0, self.height)
+        if disaster_strikes:
+            u = self.rng.random(6)
+            x, y = int(u[0] * self.width), int(u[1] * self.height)
             
             # Choose disaster type based on biome/season
             temp = self.world.temperature[y, x]
@@ -481,12 +688,13 @@ class EventsEcologySystem:
             elif temp < 0.2:
                 disaster_type = 'blizzard'
             else:
-                disaster_type = np.random.choice(['wildfire', 'flood', 'blizzard'])
+                disaster_type = ('wildfire', 'flood', 'blizzard')[int(u[2] * 3)]
             
-            intensity = np.random.uniform(0.5, 1.0)
-            duration = np.random.randint(2, 6)
+            intensity = 0.5 + 0.5 * u[3]
+            duration = 2 + int(u[4] * 4)
+            radius = 8 + int(u[5] * 12)
             
-            disaster = NaturalDisaster(x, y, disaster_type, intensity, duration)
+            disaster = NaturalDisaster(x, y, disaster_type, intensity, duration, radius)
             self.disasters.append(disaster)
             event_msg = f"{disaster_type.capitalize()} at ({x}, {y}), radius {disaster.radius}"
             print(f"  🔥 {event_msg}")
@@ -494,290 +702,250 @@ class EventsEcologySystem:
     
     def _update_scavengers(self):
         """Update scavenger behavior - seek carrion"""
-        for scavenger in self.scavengers:
-            scavenger.age += 1
-            scavenger.consume_energy(0.06)  # Low metabolism
-            
-            # Look for nearby carrion
-            best_dist = float('inf')
-            best_carrion_idx = None
-            
-            for i, (cx, cy, energy, age) in enumerate(self.carrion_locations):
-                dist = np.sqrt((cx - scavenger.x)**2 + (cy - scavenger.y)**2)
-                if dist < best_dist and energy > 0.1:
-                    best_dist = dist
-                    best_carrion_idx = i
+        pool = self.scavenger_pool
+        pool.grow_older(0.06)  # Low metabolism
+        
+        # Look for the nearest carrion (all scavengers against all sites at once)
+        food = np.flatnonzero(self.carrion_energy > 0.1)
+        if len(pool) and len(food):
+            xs, ys = pool.xs.astype(np.intp), pool.ys.astype(np.intp)
+            cx, cy = self.carrion_x[food].astype(np.intp), self.carrion_y[food].astype(np.intp)
+            # Squared distances are exact integers, so the nearest site is the same
+            dist2 = (cx - xs[:, None])**2 + (cy - ys[:, None])**2
+            nearest = dist2.argmin(axis=1)
             
             # Move toward carrion
-            if best_carrion_idx is not None and best_dist > 0:
-                cx, cy, energy, age = self.carrion_locations[best_carrion_idx]
-                dx = np.sign(cx - scavenger.x)
-                dy = np.sign(cy - scavenger.y)
-                
-                if dx != 0 or dy != 0:
-                    scavenger.move(dx, dy, self.width, self.height)
-                    scavenger.consume_energy(0.02)
-                
-                # If reached carrion, eat it
-                if scavenger.x == cx and scavenger.y == cy:
-                    consumption = min(energy, 0.4)
-                    scavenger.gain_energy(consumption * 0.5)
-                    # Update carrion
-                    self.carrion_locations[best_carrion_idx] = (cx, cy, energy - consumption, age)
+            seeking = np.flatnonzero(dist2[np.arange(len(pool)), nearest] > 0)
+            cx, cy = cx[nearest[seeking]], cy[nearest[seeking]]
+            pool.xs[seeking] = self._wrap_x[xs[seeking] + np.sign(cx - xs[seeking]) + self.width]
+            pool.ys[seeking] = self._wrap_y[ys[seeking] + np.sign(cy - ys[seeking]) + self.height]
+            pool.consume_energy(seeking, 0.02)
             
-            # Reproduce if healthy
-            if scavenger.energy > 0.7 and scavenger.age > 5 and scavenger.reproductive_cooldown == 0:
-                if np.random.random() < 0.1:
-                    offspring = Scavenger(scavenger.x, scavenger.y, 'scavenger')
-                    offspring.energy = 0.5
-                    self.scavengers.append(offspring)
-                    scavenger.reproductive_cooldown = 8
-            
-            if scavenger.reproductive_cooldown > 0:
-                scavenger.reproductive_cooldown -= 1
+            # If reached carrion, eat it (in turn order, as sites can be shared)
+            reached = (pool.xs[seeking] == cx) & (pool.ys[seeking] == cy)
+            for i, j in zip(seeking[reached].tolist(), food[nearest[seeking[reached]]].tolist()):
+                consumption = min(self.carrion_energy[j], 0.4)
+                pool.gain_energy(i, consumption * 0.5)
+                # Update carrion
+                self.carrion_energy[j] -= consumption
+        
+        # Reproduce if healthy
+        parents = np.flatnonzero((pool.energy > 0.7) & (pool.age > 5) & (pool.cooldown == 0))
+        parents = parents[self.rng.random(len(parents)) < 0.1]
+        pool.cooldown[parents] = 8
+        pool.cooldown[pool.cooldown > 0] -= 1
+        pool.add(parents, energy=0.5)
     
     def _update_avian(self, climate_engine):
         """Update bird behavior"""
-        # Spatial map for avian predation
-        avian_map = {}
-        for bird in self.avian_creatures:
-            pos = (bird.x, bird.y)
-            if pos not in avian_map:
-                avian_map[pos] = []
-            avian_map[pos].append(bird)
+        pool = self.avian_pool
+        fish = self.aquatic_pool
+        n = len(pool)
+        
+        # Birds bucketed by cell at the start of the turn, for predation and crowding:
+        # the birds in flat cell c are order[cell_start[c]:cell_start[c + 1]]
+        order, cell_start = _cell_index(pool.xs, pool.ys, self.width, self.height)
             
         # Global population pressure
-        total_avian = len(self.avian_creatures)
-        global_crowding = max(1.0, total_avian / 800.0) # Soft cap around 800
+        global_crowding = max(1.0, n / 800.0) # Soft cap around 800
 
-        for bird in self.avian_creatures:
-            bird.age += 1
-            bird.consume_energy(0.05)  # Low metabolism, efficient
-            
-            # Old age death
-            if bird.age > 100:
-                bird.consume_energy(0.1) # Rapid aging
-            
-            # Different feeding strategies
-            if bird.species == 'songbird':
-                # Eat insects first (approx 2500 per turn)
-                insects_density = self.insects.consume(bird.x, bird.y, 2500)
-                if insects_density > 0.0000001: # Any amount
-                    bird.gain_energy(0.15) # Good meal
-                    if self.logger_callback and np.random.random() < 0.1:
-                        self.logger_callback('predation', bird.species, 'insect')
-                else:
-                    # Eat seeds (vegetation)
-                    veg = self.vegetation.density[bird.y, bird.x]
-                    if veg > 0.1:
-                        bird.gain_energy(0.08)
-            
-            elif bird.species == 'insectivore':
-                # Eat insects (approx 4000 per turn)
-                insects_density = self.insects.consume(bird.x, bird.y, 4000)
-                if insects_density > 0.0000001:
-                    bird.gain_energy(0.2)
-                    if self.logger_callback and np.random.random() < 0.1:
-                        self.logger_callback('predation', bird.species, 'insect')
-            
-            elif bird.species == 'waterfowl':
-                # Need to be near water
-                if self.world.elevation[bird.y, bird.x] < 0.45:  # Near water
-                    # Eat insects or aquatic plants
-                    insects_density = self.insects.consume(bird.x, bird.y, 2000)
-                    bird.gain_energy(0.1 + (0.1 if insects_density > 0 else 0))
-                    if self.logger_callback and insects_density > 0 and np.random.random() < 0.1:
-                        self.logger_callback('predation', bird.species, 'insect')
-            
-            elif bird.species == 'raptor':
-                # Hunt small prey (birds or herbivores)
-                hunted = False
-                # Try to hunt other birds first (internal predation)
-                if (bird.x, bird.y) in avian_map:
-                    for prey in avian_map[(bird.x, bird.y)]:
-                        if prey is not bird and prey.species in ['songbird', 'insectivore', 'waterfowl']:
-                            if np.random.random() < 0.3: # 30% success
-                                prey.energy = 0 # Kill
-                                prey.cause_of_death = 'predation'
-                                bird.gain_energy(0.5)
-                                hunted = True
-                                if self.logger_callback:
-                                    self.logger_callback('predation', bird.species, prey.species)
-                                break
-                
-                if not hunted:
-                    # Hunt herbivores
-                    if np.random.random() < 0.05:  # 5% hunt success
-                        bird.gain_energy(0.4)
-            
-            elif bird.species == 'seabird':
-                # Eat fish
-                for fish in self.aquatic_creatures:
-                    if fish.species == 'fish':
-                        dist = np.sqrt((fish.x - bird.x)**2 + (fish.y - bird.y)**2)
-                        if dist < 2:
-                            if np.random.random() < 0.1:
-                                fish.energy = 0
-                                fish.cause_of_death = 'predation'
-                                bird.gain_energy(0.3)
-                                if self.logger_callback:
-                                    self.logger_callback('predation', bird.species, fish.species)
-                                break
-            
-            # Migration behavior (simplified - move toward better climate)
-            if climate_engine.season in [0, 2]:  # Spring/Fall - migration seasons
-                if np.random.random() < 0.3:
-                    # Birds can move farther
-                    dx = np.random.choice([-2, -1, 0, 1, 2])
-                    dy = np.random.choice([-2, -1, 0, 1, 2])
-                    bird.move(dx, dy, self.width, self.height)
-                    bird.consume_energy(0.03)
-            
-            # Reproduce - Density dependent
-            # Count neighbors
-            neighbors = 0
-            if (bird.x, bird.y) in avian_map:
-                neighbors = len(avian_map[(bird.x, bird.y)])
-            
-            # Lower reproduction if crowded (local AND global)
-            repro_chance = 0.15 * (1.0 / (1.0 + neighbors * 0.5)) * (1.0 / global_crowding)
-            
-            if bird.energy > 0.65 and bird.age > 3 and bird.reproductive_cooldown == 0:
-                if np.random.random() < repro_chance:
-                    # Reduced clutch size
-                    clutch_size = 1
-                    if np.random.random() < 0.3: clutch_size = 2
-                    
-                    for _ in range(clutch_size):  
-                        if np.random.random() < 0.6:
-                            chick = AvianCreature(bird.x, bird.y, bird.species)
-                            chick.energy = 0.4
-                            self.avian_creatures.append(chick)
-                    bird.reproductive_cooldown = 8 # Increased cooldown
-            
-            if bird.reproductive_cooldown > 0:
-                bird.reproductive_cooldown -= 1
+        # Fish bucketed by cell, for seabirds
+        fish_idx = np.flatnonzero(fish.species == FISH)
+        fish_order, fish_start = _cell_index(fish.xs[fish_idx], fish.ys[fish_idx], self.width, self.height)
+        fish_idx = fish_idx[fish_order]
+
+        # Low metabolism, efficient; rapid aging (old age death) past 100
+        pool.grow_older(0.05, old_age=100)
+        
+        # Different feeding strategies
+        xs, ys = pool.xs.astype(np.intp), pool.ys.astype(np.intp)
+        species = pool.species
+        
+        # Insect eaters feed in one batch: songbirds (approx 2500 insects per turn),
+        # insectivores (approx 4000) and waterfowl, which need to be near water (approx 2000).
+        # On a shared tile they eat in that order, each from what the ones before left
+        songbirds = np.flatnonzero(species == SONGBIRD)
+        insectivores = np.flatnonzero(species == INSECTIVORE)
+        waterfowl = np.flatnonzero((species == WATERFOWL) & (self.world.elevation[ys, xs] < 0.45))
+        eaters = np.concatenate((songbirds, insectivores, waterfowl))
+        appetite = np.repeat([2500, 4000, 2000], [len(songbirds), len(insectivores), len(waterfowl)])
+        eaten = self.insects.consume_batch(xs[eaters], ys[eaters], appetite)
+        songbird_meal, insectivore_meal, waterfowl_meal = np.split(eaten, [len(songbirds), len(songbirds) + len(insectivores)])
+        
+        # Songbirds eat insects first, else seeds (vegetation)
+        fed = songbird_meal > 0.0000001 # Any amount
+        pool.gain_energy(songbirds[fed], 0.15) # Good meal
+        self._log_insect_meals('songbird', np.count_nonzero(fed), 0.1)
+        seeds = songbirds[~fed]
+        pool.gain_energy(seeds[self.vegetation.density[ys[seeds], xs[seeds]] > 0.1], 0.08)
+        
+        # Insectivores eat insects
+        fed = insectivore_meal > 0.0000001
+        pool.gain_energy(insectivores[fed], 0.2)
+        self._log_insect_meals('insectivore', np.count_nonzero(fed), 0.1)
+        
+        # Waterfowl eat insects or aquatic plants
+        fed = waterfowl_meal > 0
+        pool.gain_energy(waterfowl, 0.1 + np.where(fed, 0.1, 0))
+        self._log_insect_meals('waterfowl', np.count_nonzero(fed), 0.1)
+        
+        # Raptors hunt small prey (birds or herbivores)
+        raptors = np.flatnonzero(species == RAPTOR)
+        small = np.isin(species, (SONGBIRD, INSECTIVORE, WATERFOWL))
+        hunted = np.zeros(len(raptors), dtype=bool)
+        for k, i in enumerate(raptors.tolist()):
+            # Try to hunt other birds first (internal predation): the first bird in the cell that is caught
+            cell = ys[i] * self.width + xs[i]
+            prey = order[cell_start[cell]:cell_start[cell + 1]]
+            prey = prey[small[prey]]
+            caught = prey[self.rng.random(len(prey)) < 0.3] # 30% success
+            if len(caught):
+                j = caught[0]
+                pool.energy[j] = 0 # Kill
+                pool.preyed_on[j] = True
+                pool.gain_energy(i, 0.5)
+                hunted[k] = True
+                if self.logger_callback:
+                    self.logger_callback('predation', 'raptor', AVIAN_SPECIES[species[j]])
+        
+        # Hunt herbivores
+        raptors = raptors[~hunted]
+        pool.gain_energy(raptors[self.rng.random(len(raptors)) < 0.05], 0.4)  # 5% hunt success
+        
+        # Seabirds eat fish (within distance 2: the surrounding 3x3 block, unwrapped)
+        for i in np.flatnonzero(species == SEABIRD).tolist():
+            x, y = xs[i], ys[i]
+            nearby = [fish_idx[fish_start[c]:fish_start[c + 1]]
+                      for ny in range(max(y - 1, 0), min(y + 2, self.height))
+                      for c in range(ny * self.width + max(x - 1, 0), ny * self.width + min(x + 2, self.width))]
+            nearby = np.sort(np.concatenate(nearby))
+            caught = nearby[self.rng.random(len(nearby)) < 0.1]
+            if len(caught):
+                fish.energy[caught[0]] = 0
+                fish.preyed_on[caught[0]] = True
+                pool.gain_energy(i, 0.3)
+                if self.logger_callback:
+                    self.logger_callback('predation', 'seabird', 'fish')
+        
+        # Migration behavior (simplified - move toward better climate)
+        if climate_engine.season in [0, 2]:  # Spring/Fall - migration seasons
+            movers = np.flatnonzero(self.rng.random(n) < 0.3)
+            # Birds can move farther
+            dx, dy = self.rng.integers(-2, 3, size=(2, len(movers)))
+            xs[movers] = self._wrap_x[xs[movers] + dx + self.width]
+            ys[movers] = self._wrap_y[ys[movers] + dy + self.height]
+            pool.xs[movers], pool.ys[movers] = xs[movers], ys[movers]
+            pool.consume_energy(movers, 0.03)
+        
+        # Reproduce - Density dependent
+        # Count neighbors (birds here at the start of the turn)
+        neighbors = np.diff(cell_start)[ys * self.width + xs]
+        
+        # Lower reproduction if crowded (local AND global)
+        repro_chance = 0.15 * (1.0 / (1.0 + neighbors * 0.5)) * (1.0 / global_crowding)
+        
+        parents = np.flatnonzero((pool.energy > 0.65) & (pool.age > 3) & (pool.cooldown == 0))
+        parents = parents[self.rng.random(len(parents)) < repro_chance[parents]]
+        # Reduced clutch size: 1, or 2 with 30% chance; each egg hatches with 60% chance
+        clutches = np.repeat(parents, 1 + (self.rng.random(len(parents)) < 0.3))
+        chicks = clutches[self.rng.random(len(clutches)) < 0.6]
+        pool.cooldown[parents] = 8 # Increased cooldown
+        
+        pool.cooldown[pool.cooldown > 0] -= 1
+        pool.add(chicks, energy=0.4)
+    
+    def _log_insect_meals(self, species, meals, chance):
+        """Log a random share (chance) of a species' insect meals this turn"""
+        if self.logger_callback:
+            for _ in range(self.rng.binomial(meals, chance)):
+                self.logger_callback('predation', species, 'insect')
     
     def _update_aquatic(self):
         """Update fish and marine life"""
-        # Spatial map for aquatic predation and density
-        aquatic_map = {}
-        for aq in self.aquatic_creatures:
-            pos = (aq.x, aq.y)
-            if pos not in aquatic_map:
-                aquatic_map[pos] = []
-            aquatic_map[pos].append(aq)
+        pool = self.aquatic_pool
+        n = len(pool)
+        
+        # Creatures bucketed by cell at the start of the turn, for predation and density:
+        # the creatures in flat cell c are order[cell_start[c]:cell_start[c + 1]]
+        order, cell_start = _cell_index(pool.xs, pool.ys, self.width, self.height)
             
         # Global population pressure
-        total_aquatic = len(self.aquatic_creatures)
-        global_crowding = max(1.0, total_aquatic / 1200.0) # Soft cap around 1200
+        global_crowding = max(1.0, n / 1200.0) # Soft cap around 1200
 
-        for aquatic in self.aquatic_creatures:
-            aquatic.age += 1
-            aquatic.consume_energy(0.04)
-            
-            # Old age death
-            if aquatic.age > 120:
-                aquatic.consume_energy(0.1)
-            
-            # Stay in water
-            if self.world.elevation[aquatic.y, aquatic.x] >= 0.4:
-                # Beached! Try to return to water
-                for dy in [-1, 0, 1]:
-                    for dx in [-1, 0, 1]:
-                        ny = (aquatic.y + dy) % self.height
-                        nx = (aquatic.x + dx) % self.width
-                        if self.world.elevation[ny, nx] < 0.4:
-                            aquatic.move(dx, dy, self.width, self.height)
-                            break
-            else:
-                # Feed based on water conditions
-                temp = self.world.temperature[aquatic.y, aquatic.x]
-                
-                if aquatic.species == 'fish':
-                    # Fish thrive in moderate temps
-                    if 0.4 < temp < 0.7:
-                        aquatic.gain_energy(0.12)
-                    
-                    # Eat insects if near surface/land
-                    insects_density = self.insects.consume(aquatic.x, aquatic.y, 1500)
-                    if insects_density > 0.0000001:
-                        aquatic.gain_energy(0.04) # Reduced from 0.1
-                        if self.logger_callback and np.random.random() < 0.05:
-                            self.logger_callback('predation', aquatic.species, 'insect')
-                    
-                    # School behavior - move randomly
-                    if np.random.random() < 0.4:
-                        dx = np.random.choice([-1, 0, 1])
-                        dy = np.random.choice([-1, 0, 1])
-                        nx = (aquatic.x + dx) % self.width
-                        ny = (aquatic.y + dy) % self.height
-                        if self.world.elevation[ny, nx] < 0.4:
-                            aquatic.move(dx, dy, self.width, self.height)
-                
-                elif aquatic.species == 'predatory_fish':
-                    # Hunt smaller fish
-                    if (aquatic.x, aquatic.y) in aquatic_map:
-                        for prey in aquatic_map[(aquatic.x, aquatic.y)]:
-                            if prey.species == 'fish':
-                                if np.random.random() < 0.2:
-                                    prey.energy = 0
-                                    prey.cause_of_death = 'predation'
-                                    aquatic.gain_energy(0.3)
-                                    if self.logger_callback:
-                                        self.logger_callback('predation', aquatic.species, prey.species)
-                                    break
-                
-                elif aquatic.species == 'marine_mammal':
-                    # Larger, hunt fish
-                    if (aquatic.x, aquatic.y) in aquatic_map:
-                        for prey in aquatic_map[(aquatic.x, aquatic.y)]:
-                            if prey.species in ['fish', 'predatory_fish']:
-                                if np.random.random() < 0.15:
-                                    prey.energy = 0
-                                    prey.cause_of_death = 'predation'
-                                    aquatic.gain_energy(0.25)
-                                    if self.logger_callback:
-                                        self.logger_callback('predation', aquatic.species, prey.species)
-                                    break
-                
-                elif aquatic.species == 'shark':
-                    # Apex predator
-                    if (aquatic.x, aquatic.y) in aquatic_map:
-                        for prey in aquatic_map[(aquatic.x, aquatic.y)]:
-                            if prey is not aquatic and prey.species in ['fish', 'predatory_fish', 'marine_mammal']:
-                                if np.random.random() < 0.25:
-                                    prey.energy = 0
-                                    prey.cause_of_death = 'predation'
-                                    aquatic.gain_energy(0.4)
-                                    if self.logger_callback:
-                                        self.logger_callback('predation', aquatic.species, prey.species)
-                                    break
-            
-            # Density check
-            neighbors = 0
-            if (aquatic.x, aquatic.y) in aquatic_map:
-                neighbors = len(aquatic_map[(aquatic.x, aquatic.y)])
-            
-            # Overcrowding penalty
-            if neighbors > 5:
-                aquatic.consume_energy(0.01 * (neighbors - 5))
-            
-            # Reproduce
-            repro_chance = 0.2 * (1.0 / (1.0 + neighbors * 0.3)) * (1.0 / global_crowding)
-            
-            if aquatic.energy > 0.7 and aquatic.age > 4 and aquatic.reproductive_cooldown == 0:
-                if np.random.random() < repro_chance:
-                    offspring_count = 2 if aquatic.species == 'fish' else 1 # Reduced from 3
-                    for _ in range(offspring_count):
-                        if np.random.random() < 0.5:
-                            baby = AquaticCreature(aquatic.x, aquatic.y, aquatic.species)
-                            baby.energy = 0.5
-                            self.aquatic_creatures.append(baby)
-                    aquatic.reproductive_cooldown = 10 # Increased from 8
-            
-            if aquatic.reproductive_cooldown > 0:
-                aquatic.reproductive_cooldown -= 1
+        # Old age death past 120
+        pool.grow_older(0.04, old_age=120)
+        
+        # Terrain under everyone at the start of the turn
+        xs, ys = pool.xs.astype(np.intp), pool.ys.astype(np.intp)
+        beached = self.world.elevation[ys, xs] >= 0.4
+        species = pool.species
+        
+        # Stay in water: beached creatures try to return to water
+        for i in np.flatnonzero(beached).tolist():
+            x, y = int(xs[i]), int(ys[i])
+            for dy in [-1, 0, 1]:
+                for dx in [-1, 0, 1]:
+                    ny = (y + dy) % self.height
+                    nx = (x + dx) % self.width
+                    if self.world.elevation[ny, nx] < 0.4:
+                        x, y = nx, ny
+                        break
+            pool.xs[i], pool.ys[i] = x, y
+        
+        # Fish in water feed based on water conditions
+        fish = np.flatnonzero(~beached & (species == FISH))
+        temp = self.world.temperature[ys[fish], xs[fish]]
+        pool.gain_energy(fish[(temp > 0.4) & (temp < 0.7)], 0.12)  # Fish thrive in moderate temps
+        
+        # Eat insects if near surface/land (fish sharing a tile split what is there)
+        fed = self.insects.consume_batch(xs[fish], ys[fish], 1500) > 0.0000001
+        pool.gain_energy(fish[fed], 0.04) # Reduced from 0.1
+        self._log_insect_meals('fish', np.count_nonzero(fed), 0.05)
+        
+        # School behavior - move randomly (staying in water)
+        dx, dy = self.rng.integers(-1, 2, size=(2, len(fish)))
+        step_x = self._wrap_x[xs[fish] + dx + self.width]
+        step_y = self._wrap_y[ys[fish] + dy + self.height]
+        movers = (self.rng.random(len(fish)) < 0.4) & (self.world.elevation[step_y, step_x] < 0.4)
+        pool.xs[fish[movers]], pool.ys[fish[movers]] = step_x[movers], step_y[movers]
+        
+        # Hunters in water hunt at their own cell: every (hunter, prey) pair sharing a
+        # start-of-turn cell gets one roll, and each hunter takes the first prey it caught
+        hunters = np.flatnonzero(~beached & (species != FISH))
+        prey, k = _cell_members(order, cell_start, ys[hunters] * self.width + xs[hunters])
+        hunter = hunters[k]
+        edible = _HUNT_PREY[species[hunter], species[prey]]
+        hunter, prey = hunter[edible], prey[edible]
+        caught = self.rng.random(len(prey)) < _HUNT_SUCCESS[species[hunter]]
+        hunter, first = np.unique(hunter[caught], return_index=True)
+        prey = prey[caught][first]
+        pool.gain_energy(hunter, _HUNT_REWARD[species[hunter]])
+        pool.energy[prey] = 0
+        pool.preyed_on[prey] = True
+        if self.logger_callback:
+            for i, j in zip(species[hunter].tolist(), species[prey].tolist()):
+                self.logger_callback('predation', AQUATIC_SPECIES[i], AQUATIC_SPECIES[j])
+        
+        # Density check: start-of-turn counts at everyone's cell now
+        neighbors = np.diff(cell_start)[pool.ys.astype(np.intp) * self.width + pool.xs]
+        
+        # Overcrowding penalty
+        crowded = neighbors > 5
+        pool.consume_energy(crowded, 0.01 * (neighbors[crowded] - 5))
+        
+        # Reproduce
+        repro_chance = 0.2 * (1.0 / (1.0 + neighbors * 0.3)) * (1.0 / global_crowding)
+        
+        parents = np.flatnonzero((pool.energy > 0.7) & (pool.age > 4) & (pool.cooldown == 0) &
+                                 (self.rng.random(n) < repro_chance))
+        pool.cooldown[parents] = 10 # Increased from 8
+        
+        # Fish lay 2 eggs, the rest 1 (reduced from 3); each hatches with 50% chance
+        eggs = np.repeat(parents, np.where(pool.species[parents] == FISH, 2, 1))
+        babies = eggs[self.rng.random(len(eggs)) < 0.5]
+        
+        pool.cooldown[pool.cooldown > 0] -= 1
+        pool.add(babies, energy=0.5)
     
     def _handle_migration(self, climate_engine):
         """Allow species to migrate back if extinct or low population"""
@@ -789,8 +957,7 @@ class EventsEcologySystem:
             return
 
         # Check Herbivores
-        for species in self.herbivores.herbivore_species.keys():
-            count = sum(1 for h in self.herbivores.herbivores if h.species == species)
+        for species, count in self.herbivores.get_population_counts().items():
             if count < 8: # Critically low
                 # Chance to migrate increases if population is 0
                 chance = 0.1 if count > 0 else 0.2
@@ -798,8 +965,7 @@ class EventsEcologySystem:
                     self.herbivores.spawn_migrants(species, count=np.random.randint(3, 8))
 
         # Check Predators
-        for species in self.predators.predator_species.keys():
-            count = sum(1 for p in self.predators.predators if p.species == species)
+        for species, count in self.predators.get_population_counts().items():
             if count < 3:
                 chance = 0.05 if count > 0 else 0.15
                 if np.random.random() < chance:
@@ -814,13 +980,15 @@ class EventsEcologySystem:
             'insects': self.insects.get_total_count(),
             'active_diseases': len(self.diseases),
             'active_disasters': len(self.disasters),
-            'carrion_sites': len(self.carrion_locations),
+            'carrion_sites': len(self.carrion_x),
             'disease_deaths': self.disease_deaths,
             'disaster_deaths': self.disaster_deaths
         }
     
     def visualize(self):
         """Visualize the complete ecology"""
+        from matplotlib.colors import to_rgba_array
+        
         fig = plt.figure(figsize=(16, 10))
         gs = fig.add_gridspec(2, 3, height_ratios=[2, 1])
         
@@ -828,40 +996,32 @@ class EventsEcologySystem:
         ax_main = fig.add_subplot(gs[0, :])
         
         # Background: terrain
-        terrain_display = np.zeros((self.height, self.width, 3))
-        for y in range(self.height):
-            for x in range(self.width):
-                elev = self.world.elevation[y, x]
-                if elev < 0.4:
-                    terrain_display[y, x] = [0, 0.2, 0.5]  # Water - blue
-                else:
-                    veg = self.vegetation.density[y, x]
-                    terrain_display[y, x] = [0.8 - veg * 0.6, 0.6 + veg * 0.4, 0.3]  # Land - brown to green
+        veg = self.vegetation.density
+        land = np.stack([0.8 - veg * 0.6, 0.6 + veg * 0.4, np.full_like(veg, 0.3)], axis=-1)  # Land - brown to green
+        water = (self.world.elevation < 0.4)[..., None]
+        terrain_display = np.where(water, [0, 0.2, 0.5], land)  # Water - blue
         
         ax_main.imshow(terrain_display)
         
-        # Plot all creatures
+        # Plot all creatures, one scatter per group (marker area s is markersize squared)
         # Aquatic
-        for aq in self.aquatic_creatures:
-            ax_main.plot(aq.x, aq.y, 'o', color='cyan', markersize=1, alpha=0.6)
+        ax_main.scatter(*self._coords(self.aquatic_creatures), color='cyan', marker='o', s=1, alpha=0.6, linewidths=0)
         
         # Herbivores
-        for herb in self.herbivores.herbivores:
-            ax_main.plot(herb.x, herb.y, 'o', color='tan', markersize=2, alpha=0.5)
+        ax_main.scatter(*self._coords(self.herbivores.herbivores), color='tan', marker='o', s=4, alpha=0.5, linewidths=0)
         
         # Predators
-        for pred in self.predators.predators:
-            ax_main.plot(pred.x, pred.y, '^', color='red', markersize=4, alpha=0.7)
+        ax_main.scatter(*self._coords(self.predators.predators), color='red', marker='^', s=16, alpha=0.7, linewidths=0)
         
-        # Avian
-        for bird in self.avian_creatures:
-            color = {'songbird': 'yellow', 'waterfowl': 'lightblue', 
-                    'raptor': 'orange', 'seabird': 'white'}.get(bird.species, 'gray')
-            ax_main.plot(bird.x, bird.y, '*', color=color, markersize=3, alpha=0.6)
+        # Avian, colored per point from a species code table
+        bird_colors = {'songbird': 'yellow', 'waterfowl': 'lightblue', 'raptor': 'orange', 'seabird': 'white'}
+        color_lut = to_rgba_array([bird_colors.get(species, 'gray') for species in AVIAN_SPECIES])
+        species = np.fromiter((self.avian_pool.species_index[bird.species] for bird in self.avian_creatures),
+                              dtype=np.intp, count=len(self.avian_creatures))
+        ax_main.scatter(*self._coords(self.avian_creatures), c=color_lut[species], marker='*', s=9, alpha=0.6, linewidths=0)
         
         # Scavengers
-        for scav in self.scavengers:
-            ax_main.plot(scav.x, scav.y, 'v', color='brown', markersize=3, alpha=0.7)
+        ax_main.scatter(*self._coords(self.scavengers), color='brown', marker='v', s=9, alpha=0.7, linewidths=0)
         
         # Events
         for disease in self.diseases:
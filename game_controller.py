@@ -53,6 +53,9 @@ class WorldConfig:
         
         # Game Rules
         self.fog_of_war = True
+        
+        # Console output (season banners, weather events); not saved
+        self.verbose = True
     
     def to_dict(self):
         """Convert to dictionary for saving"""
@@ -138,7 +141,7 @@ class GameState:
         self.world.generate_world(sea_level=self.config.sea_level)
         
         # Initialize climate
-        self.climate = ClimateEngine(self.world)
+        self.climate = ClimateEngine(self.world, verbose=self.config.verbose)
         
         # Initialize vegetation
         self.vegetation = VegetationSystem(self.world)
@@ -738,13 +741,13 @@ class SaveSystem:
         )
         game_state.world.elevation = np.array(save_data['world_elevation'])
         game_state.world.biomes = np.array(save_data['world_biomes'])
-        game_state.world.temperature = np.array(save_data['current_temperature'])
-        game_state.world.moisture = np.array(save_data['current_moisture'])
+        game_state.world.temperature = np.array(save_data['current_temperature'], dtype=np.float32)
+        game_state.world.moisture = np.array(save_data['current_moisture'], dtype=np.float32)
         
         # Restore climate
-        game_state.climate = ClimateEngine(game_state.world)
-        game_state.climate.base_temperature = np.array(save_data['base_temperature'])
-        game_state.climate.base_moisture = np.array(save_data['base_moisture'])
+        game_state.climate = ClimateEngine(game_state.world, verbose=config.verbose)
+        game_state.climate.base_temperature = np.array(save_data['base_temperature'], dtype=np.float32)
+        game_state.climate.base_moisture = np.array(save_data['base_moisture'], dtype=np.float32)
         game_state.climate.current_turn = save_data['climate_turn']
         game_state.climate.season = save_data['climate_season']
         game_state.climate.year = save_data['climate_year']
@@ -3,8 +3,13 @@ import matplotlib.pyplot as plt
 from srpg_stats import create_stats_from_template, PREDATOR_STATS
 from srpg_combat import CombatResolver
 from balance_config import PREDATOR_CONFIG
+from terrain_generator import NUM_BIOMES
 import uuid
 
+# Integer species ids (PREDATOR_STATS order) used to index the per-species lookup tables
+SPECIES_NAMES = list(PREDATOR_STATS.keys())
+SPECIES_INDEX = {name: i for i, name in enumerate(SPECIES_NAMES)}
+
 class Predator:
     """Carnivore that hunts herbivores"""
     def __init__(self, x, y, species_name):
@@ -12,6 +17,7 @@ class Predator:
         self.x = x
         self.y = y
         self.species = species_name
+        self.species_idx = SPECIES_INDEX.get(species_name, SPECIES_INDEX['wolf'])
         
         # Initialize stats from template
         template = PREDATOR_STATS.get(species_name, PREDATOR_STATS['wolf'])
@@ -102,6 +108,17 @@ class PredatorSystem:
         # Use SRPG stats
         self.predator_species = PREDATOR_STATS
         
+        # Terrain preference per (species id, biome id), 0.3 where unspecified
+        self.pref_lut = np.full((len(SPECIES_NAMES), NUM_BIOMES), 0.3)
+        for i, name in enumerate(SPECIES_NAMES):
+            for biome, pref in PREDATOR_STATS[name]['movement'].terrain_preferences.items():
+                self.pref_lut[i, biome] = pref
+        
+        # Metabolism multiplier per species id: species override, else the global balance value
+        self.metabolism_lut = [PREDATOR_STATS[name].get('metabolism_multiplier',
+                                                    PREDATOR_CONFIG.get('metabolism_multiplier', 1.0))
+                               for name in SPECIES_NAMES]
+        
         self.population_history = {species: [] for species in self.predator_species.keys()}
         self.kill_history = {species: [] for species in self.predator_species.keys()}
         self.recent_deaths = {}
@@ -132,8 +149,7 @@ class PredatorSystem:
             attempts = 0
             max_attempts = population_per_species * 20
             
-            movement_stats = species_data['movement']
-            preferred_biomes = [b for b, m in movement_stats.terrain_preferences.items() if m >= 0.8]
+            preferred = self.pref_lut[SPECIES_INDEX[species_name]] >= 0.8
             
             while spawned < population_per_species and attempts < max_attempts:
                 attempts += 1
@@ -143,7 +159,7 @@ class PredatorSystem:
                 biome = self.world.biomes[y, x]
                 
                 # Check habitat suitability
-                if biome in preferred_biomes:
+                if preferred[biome]:
                     
                     # Check for nearby prey
                     prey_nearby = self._count_nearby_prey(x, y, 10)
@@ -159,8 +175,7 @@ class PredatorSystem:
             print(f"  🐺 Spawned {spawned} {species_name}")
         
         # Initialize history
-        for species_name in self.predator_species.keys():
-            count = sum(1 for p in self.predators if p.species == species_name)
+        for species_name, count in zip(SPECIES_NAMES, self._species_counts().tolist()):
             self.population_history[species_name].append(count)
             self.kill_history[species_name].append(0)
     
@@ -185,13 +200,9 @@ class PredatorSystem:
 
             predator.age += 1
             
-            # Get species data
-            species_data = self.predator_species[predator.species]
-            
             # Metabolism cost
             base_cost = 1
-            # Use species specific multiplier if available, else global config
-            multiplier = species_data.get('metabolism_multiplier', PREDATOR_CONFIG.get('metabolism_multiplier', 1.0))
+            multiplier = self.metabolism_lut[predator.species_idx]
             
             # Apply multiplier (probabilistic for fractional values)
             cost_float = base_cost * multiplier
@@ -314,11 +325,16 @@ class PredatorSystem:
             pass
         
         # Track statistics
-        for species_name in self.predator_species.keys():
-            count = sum(1 for p in self.predators if p.species == species_name)
+        for species_name, count in zip(SPECIES_NAMES, self._species_counts().tolist()):
             self.population_history[species_name].append(count)
             self.kill_history[species_name].append(kills_this_turn[species_name])
     
+    def _species_counts(self):
+        """Population per species id in a single pass"""
+        species_idx = np.fromiter((p.species_idx for p in self.predators), dtype=np.uint8,
+                                  count=len(self.predators))
+        return np.bincount(species_idx, minlength=len(SPECIES_NAMES))
+    
     def _count_nearby_prey(self, x, y, radius):
         """Count herbivores within radius using spatial map"""
         count = 0
@@ -457,7 +473,7 @@ class PredatorSystem:
         is_hungry = predator.combat_stats.hp_percentage() < 0.7
         
         current_biome = self.world.biomes[predator.y, predator.x]
-        biome_pref = movement_stats.terrain_preferences.get(current_biome, 0.3)
+        biome_pref = self.pref_lut[predator.species_idx, current_biome]
         good_habitat = biome_pref >= 0.6
         
         if not is_hungry and good_habitat:
@@ -515,7 +531,7 @@ class PredatorSystem:
                 ny = (predator.y + move_dy) % self.height
                 n_biome = self.world.biomes[ny, nx]
                 
-                if movement_stats.can_swim or n_biome not in [0, 1]:
+                if movement_stats.can_swim or n_biome > 1:
                     predator.move(move_dx, move_dy, self.width, self.height)
                 return
 
@@ -534,10 +550,10 @@ class PredatorSystem:
             dest_biome = self.world.biomes[ny, nx]
             
             # Check water
-            if not movement_stats.can_swim and dest_biome in [0, 1]:
+            if not movement_stats.can_swim and dest_biome <= 1:
                 continue
                 
-            dest_pref = movement_stats.terrain_preferences.get(dest_biome, 0.3)
+            dest_pref = self.pref_lut[predator.species_idx, dest_biome]
             
             if dest_pref > best_score:
                 best_score = dest_pref
@@ -554,7 +570,7 @@ class PredatorSystem:
                     nx = (predator.x + dx) % self.width
                     ny = (predator.y + dy) % self.height
                     n_biome = self.world.biomes[ny, nx]
-                    if movement_stats.can_swim or n_biome not in [0, 1]:
+                    if movement_stats.can_swim or n_biome > 1:
                         valid_moves.append((dx, dy))
             
             if valid_moves:
@@ -606,10 +622,7 @@ class PredatorSystem:
     
     def get_population_counts(self):
         """Return current populations"""
-        counts = {species: 0 for species in self.predator_species.keys()}
-        for pred in self.predators:
-            counts[pred.species] += 1
-        return counts
+        return dict(zip(SPECIES_NAMES, self._species_counts().tolist()))
     
     def visualize(self, show_populations=True):
         """Display predator distribution and dynamics"""
@@ -694,9 +707,7 @@ class PredatorSystem:
         attempts = 0
         max_attempts = count * 10
         
-        species_data = self.predator_species[species_name]
-        movement_stats = species_data['movement']
-        preferred_biomes = [b for b, m in movement_stats.terrain_preferences.items() if m >= 0.6]
+        preferred = self.pref_lut[SPECIES_INDEX[species_name]] >= 0.6
         
         while spawned < count and attempts < max_attempts:
             attempts += 1
@@ -711,7 +722,7 @@ class PredatorSystem:
             biome = self.world.biomes[y, x]
             
             # Check if location is suitable
-            if biome in preferred_biomes:
+            if preferred[biome]:
                 predator = Predator(x, y, species_name)
                 # Migrants are usually
                 predator.combat_stats.current_hp = int(predator.combat_stats.max_hp * 0.9)
@@ -15,6 +15,7 @@ def run_single_simulation(turns=100, seed=None):
     config.height = 80
     config.seed = seed
     config.fog_of_war = False # Don't need fog for simulation
+    config.verbose = False # No season/weather banners in batch runs
     
     # Suppress print output during simulation
     # original_stdout = sys.stdout
@@ -133,6 +133,33 @@ class CombatResolver:
         
         return actual_consumption
     
+    def resolve_herbivore_feeding_batch(self, current_hp, max_hp, vegetation_density,
+                                        cell_ids) -> tuple:
+        """
+        Vectorized resolve_herbivore_feeding for many herbivores at once.
+        Herbivores sharing a cell must be adjacent (grouped by cell_ids) and eat
+        one after another in array order; vegetation_density is the density of
+        each herbivore's cell before any of them eat.
+        Returns: (amount consumed, HP gained) per herbivore
+        """
+        # Hunger determines consumption
+        hunger = max_hp - current_hp
+        wanted = np.minimum(0.3, hunger / VEGETATION_STATS['food_value'])
+        if len(wanted) == 0:
+            return wanted, np.zeros(0, dtype=int)
+        
+        # Vegetation left over by the herbivores ahead in the same cell
+        eaten_before = np.cumsum(wanted) - wanted
+        group_start = np.r_[True, cell_ids[1:] != cell_ids[:-1]]
+        eaten_before -= eaten_before[group_start][np.cumsum(group_start) - 1]
+        available = vegetation_density - eaten_before
+        
+        # Can only eat if vegetation exists
+        consumption = np.where(available < 0.05, 0.0, np.minimum(available, wanted))
+        hp_gained = (consumption * VEGETATION_STATS['food_value']).astype(int)
+        
+        return consumption, hp_gained
+    
     def resolve_environmental_damage(self, creature, hazard_type, hazard_intensity) -> int:
         """
         Apply environmental damage (fire, flood, blizzard, etc.)
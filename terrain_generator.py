@@ -1,7 +1,20 @@
+import functools
+import hashlib
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 
+# Size of the biome id table: ids 0-11 come from generate_biomes, 12 is swamp
+# (only referenced by species terrain preferences)
+NUM_BIOMES = 13
+
+@functools.lru_cache(maxsize=None)
+def _generator_digest():
+    """Digest of this module's source, so cached worlds are invalidated when generation code changes"""
+    with open(__file__, 'rb') as source:
+        return hashlib.sha1(source.read()).hexdigest()[:12]
+
 class WorldGenerator:
     def __init__(self, width=100, height=100, seed=None):
         self.width = width
@@ -182,8 +195,19 @@ class WorldGenerator:
                 else:  # Very cold
                     self.biomes[y, x] = 10  # Snow
     
-    def generate_world(self, sea_level=0.4):
-        """Generate complete world with all layers"""
+    def generate_world(self, sea_level=0.4, cache_dir=None):
+        """Generate complete world with all layers
+        
+        With a cache_dir and a fixed seed, the generated layers (plus the global
+        RNG state generation leaves behind) are saved there and reloaded by later
+        runs, so seeded worlds are only generated once.
+        """
+        cache_path = self._world_cache_path(cache_dir, sea_level)
+        if cache_path and os.path.exists(cache_path):
+            self._load_world_cache(cache_path)
+            print("World loaded from cache!")
+            return
+        
         print("Generating elevation...")
         self.generate_elevation(sea_level=sea_level)
         print("Generating temperature...")
@@ -193,6 +217,37 @@ class WorldGenerator:
         print("Deriving biomes...")
         self.generate_biomes(sea_level=sea_level)
         print("World generation complete!")
+        
+        if cache_path:
+            self._save_world_cache(cache_path)
+    
+    def _world_cache_path(self, cache_dir, sea_level):
+        """Cache file for this world's parameters, or None when caching does not apply"""
+        if cache_dir is None or not self.seed:
+            return None
+        name = f"world_{self.seed}_{self.width}x{self.height}_{sea_level}_{_generator_digest()}.npz"
+        return os.path.join(cache_dir, name)
+    
+    def _save_world_cache(self, cache_path):
+        """Write the generated layers and the post-generation RNG state"""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        _, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, elevation=self.elevation, temperature=self.temperature,
+                     moisture=self.moisture, biomes=self.biomes,
+                     rng_keys=keys, rng_state=np.array([pos, has_gauss, cached_gaussian]))
+        os.replace(tmp_path, cache_path)
+    
+    def _load_world_cache(self, cache_path):
+        """Restore layers and RNG state, as if the world had just been generated"""
+        with np.load(cache_path) as data:
+            self.elevation = data['elevation']
+            self.temperature = data['temperature']
+            self.moisture = data['moisture']
+            self.biomes = data['biomes']
+            pos, has_gauss, cached_gaussian = data['rng_state']
+            np.random.set_state(('MT19937', data['rng_keys'], int(pos), int(has_gauss), float(cached_gaussian)))
     
     def visualize(self):
         """Display all layers"""
@@ -239,5 +294,5 @@ class WorldGenerator:
 # Generate and visualize
 if __name__ == "__main__":
     world = WorldGenerator(width=150, height=100, seed=42)
-    world.generate_world(sea_level=0.42)
+    world.generate_world(sea_level=0.42, cache_dir=".world_cache")
     world.visualize()
@@ -0,0 +1,46 @@
+
+from game_controller import GameState, WorldConfig
+from animal_system import Animal
+
+def make_empty_game():
+    config = WorldConfig()
+    config.width = 30
+    config.height = 20
+    config.herbivore_population = 0
+    config.predator_population = 0
+    config.verbose = False
+
+    game = GameState(config)
+    game.initialize_world()
+    return game
+
+def test_update_without_herbivores():
+    print("Testing feeding with no herbivores...")
+
+    game = make_empty_game()
+    game.animals.herbivores.clear()
+
+    for i in range(4):
+        game.animals.update(game.climate)
+
+    assert game.animals.herbivores == []
+
+def test_update_with_only_fed_frogs():
+    print("Testing feeding when every herbivore is a frog that ate insects...")
+
+    game = make_empty_game()
+    game.animals.herbivores.clear()
+
+    # Plenty of insects everywhere, so every frog eats and none graze
+    game.ecology.insects.density[:] = 1.0
+    frogs = [Animal(5 + i, 10, 'frog') for i in range(3)]
+    game.animals.herbivores.extend(frogs)
+
+    game.animals.update(game.climate)
+
+    for frog in frogs:
+        print(f"Frog {frog.id}: HP={frog.combat_stats.current_hp}, Alive={frog.is_alive()}")
+
+if __name__ == "__main__":
+    test_update_without_herbivores()
+    test_update_with_only_fed_frogs()